@@ -1,5 +1,6 @@
 import os
 import json
+import asyncio
 import random
 from time import time
 
@@ -7,8 +8,16 @@ from monsterui.all import *
 from fasthtml.common import *
 from fasthtml.oauth import GoogleAppClient, OAuth
 from dotenv import load_dotenv
-from netatmo_thermostat.core import Thermostat, ThermostatWidget, setup_thermostat_widget
-from netatmo_thermostat.solar import SolaX, SolarWidget
+from netatmo_thermostat import __version__
+from netatmo_thermostat.core import Thermostat
+from netatmo_thermostat.solar import AsyncSolaX
+from netatmo_thermostat.widgets import setup_thermostat_grid, setup_solar_widget, setpoint_writes, thermostat_fragments, SolarCard
+from netatmo_thermostat.telemetry import SolarLog
+from netatmo_thermostat.live import Poller, setup_live, sse_hdr
+from netatmo_thermostat.render import FragmentCache, conditional, data_key
+from netatmo_thermostat.metrics import Metrics, MetricsMiddleware, setup_metrics_route
+from netatmo_thermostat.shared import SQLiteState, SharedCache, SharedTokens, Leader
+from starlette.middleware.gzip import GZipMiddleware
 
 load_dotenv()
 
@@ -22,11 +31,42 @@ class Auth(OAuth):
         if info.email_verified and email in accepted_emails:
             return RedirectResponse('/', status_code=303)
 
+# Auth / SDK Setup
+CLIENT_ID = os.environ['CLIENT_ID']
+CLIENT_SECRET = os.environ['CLIENT_SECRET']
+REFRESH_TOKEN = os.environ['REFRESH_TOKEN']
+
+# Request latencies, token refreshes, cache hits and route timings, scraped from /metrics with METRICS_TOKEN as a bearer token.
+# Without a token the middleware only records, and /metrics is served as an app route behind the Google login.
+metrics_token = os.getenv('METRICS_TOKEN')
+metrics = Metrics()
+# Workers share cached responses, rotated tokens and the poller's readings through one SQLite file
+state = SQLiteState(os.getenv('SHARED_STATE', 'shared_state.db'))
+# API clients keep one pooled connection each, closed when the app shuts down
+t = Thermostat(CLIENT_ID, CLIENT_SECRET, refresh_token=REFRESH_TOKEN, cache=SharedCache(state), tokens=SharedTokens(state), metrics=metrics)
+s = AsyncSolaX(metrics=metrics)
+# A month of solar readings, kept on disk so the sparklines survive restarts
+solar_log = SolarLog(path=os.getenv('SOLAR_LOG', 'solar_log.npy'))
+# One background poll per source for all viewers, pushed to open dashboards over SSE; only the worker holding the lease polls upstream
+leader = Leader(state, 'poller')
+poller = Poller(leader=leader)
+# Setpoint clicks are collapsed per room into one Netatmo write, flushed on shutdown
+setpoints = setpoint_writes(t)
+
+# Homes are fetched once the server is up, so importing the app doesn't touch the network
+home_ids = []
+async def bootstrap():
+    try: home_ids[:] = [h.id for h in (await asyncio.to_thread(t.homesdata)).homes]
+    except Exception as e:
+        print(f"Error getting homes: {e}")
+        raise
+
 # Initialize App
-app, rt = fast_app(hdrs=(
+app, rt = fast_app(middleware=[Middleware(GZipMiddleware, minimum_size=500), Middleware(MetricsMiddleware, metrics=metrics, path='/metrics' if metrics_token else None, token=metrics_token)], on_startup=[bootstrap, poller.start], on_shutdown=[poller.stop, leader.release, setpoints.flush, solar_log.flush, t.close, s.close], hdrs=(
     Theme.blue.headers(apex_charts=True),
     Script(src="https://cdn.jsdelivr.net/npm/apexcharts"),
     Script(src="https://cdn.tailwindcss.com"),
+    sse_hdr,
     Link(href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600&family=Outfit:wght@300;400;600&display=swap", rel="stylesheet"),
     Script("""
         tailwind.config = {
@@ -54,11 +94,7 @@ app, rt = fast_app(hdrs=(
 
 skip = ('/login', '/logout', '/redirect', r'/.*\.(png|jpg|ico|css|js|md|svg)', '/static')
 oauth = Auth(app, cli, skip=skip)
-
-# Auth / SDK Setup
-CLIENT_ID = os.environ['CLIENT_ID']
-CLIENT_SECRET = os.environ['CLIENT_SECRET']
-REFRESH_TOKEN = os.environ['REFRESH_TOKEN']
+if not metrics_token: setup_metrics_route(rt, metrics)
 
 @rt('/login')
 @rt
@@ -83,22 +119,17 @@ def logout(session):
     return RedirectResponse('/login', status_code=303)
 
 
-# Initialize Thermostat globally and setup widget routes
-t = Thermostat(CLIENT_ID, CLIENT_SECRET, refresh_token=REFRESH_TOKEN)
-main_room, room_id = None, None
-try:
-    hd = t.homesdata()
-    home_id = hd.homes[0].id
-    room_id = hd.homes[0].rooms[0].id
-except Exception as e:
-    print(f"Error getting home & room id: {e}")
-    raise
-
-# Register the library's widget routes (handle /setpoint POST)
-thermostat_widget = setup_thermostat_widget(rt, t, home_id, room_id, xtra_classes='relative')
+# Register the library's widget routes (the cards and their /setpoint POSTs). The page only holds placeholders
+# that load each widget from its route, so a slow upstream never delays the page or the other widgets.
+# Readings are pushed live over SSE below; the charts are refreshed every 15 minutes.
+# The solar card shows the poller's latest reading, so only the leader calls SolaX and records into the shared log.
+thermostat_grid = setup_thermostat_grid(rt, t, home_ids, setpoints, every=900, metrics=metrics, xtra_classes='relative', cls='contents')
+solar_widget = setup_solar_widget(rt, s, log=solar_log, metrics=metrics, poller=poller, xtra_classes='relative')
 
-# Initialize SolaX
-s = SolaX()
+poller.add('thermostat', lambda: asyncio.to_thread(lambda: [t.homestatus(h) for h in home_ids]),
+           lambda sts: [f for st in sts for f in thermostat_fragments(st)], every=60)
+poller.add('solar', lambda: solar_log.poll(s), lambda r: SolarCard(r.result, xtra_classes='relative', hist=solar_log.arrays(86400)), every=60)
+live = setup_live(rt, poller)
 
 
 
@@ -113,9 +144,15 @@ def DashboardCard(title, children, extra_classes=""):
         cls=f"bg-white/85 backdrop-blur-xl border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col h-full min-h-[320px] transition-transform hover:-translate-y-1 duration-300 {extra_classes}"
     )
 
+# The page shell only changes with a deploy: it is rendered once, and a tablet reloading it gets a 304
+pages = FragmentCache(maxsize=1)
+metrics.watch(pages.cache, '/')
+
 @rt("/")
-def get():
-    return Title("Tordera Dashboard"), Body(
+async def get(req): return conditional(req, shell, lambda: (Title("Tordera Dashboard"), pages(shell, dashboard)))
+
+def dashboard():
+    return Body(
         Div(
             # Main Flex/Grid Container
             Div(
@@ -129,12 +166,12 @@ def get():
                 # Right Column: Widgets (Scrollable content)
                 Div(
                     Div(
-                        # Climate Widget (From SDK)
-                        thermostat_widget,
+                        # Climate Widgets (From SDK), one per room
+                        thermostat_grid,
                         # ThermostatWidget(t, home_id, room_id, xtra_classes='relative'),  
 
                         # Energy Widget (From SolaX)
-                        SolarWidget(s, xtra_classes='relative'), 
+                        solar_widget,
                         
                         cls="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-2 gap-6 w-full max-w-4xl" # Widget Grid
                     ),
@@ -143,10 +180,14 @@ def get():
                 
                 cls="flex flex-col lg:flex-row min-h-screen w-full relative"
             ),
+            live,
             cls="w-full min-h-screen"
         ),
         cls="bg-slate-50 text-slate-700 min-h-screen m-0 p-0",
         style="background-image: radial-gradient(at 0% 0%, hsla(190, 100%, 95%, 1) 0, transparent 50%), radial-gradient(at 50% 0%, hsla(220, 100%, 92%, 1) 0, transparent 50%);"
     )
 
+# Its ETag hashes the markup and the package version rather than the start time, so it survives restarts and every worker agrees on it
+shell = data_key(__version__, to_xml(dashboard()))
+
 serve()
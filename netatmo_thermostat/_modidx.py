@@ -5,17 +5,64 @@ d = { 'settings': { 'branch': 'main',
                 'doc_host': 'https://kafkasl.github.io',
                 'git_url': 'https://github.com/kafkasl/netatmo-thermostat',
                 'lib_path': 'netatmo_thermostat'},
-  'syms': { 'netatmo_thermostat.core': { 'netatmo_thermostat.core.ControlBtn': ('core.html#controlbtn', 'netatmo_thermostat/core.py'),
-                                         'netatmo_thermostat.core.SetpointDisplay': ( 'core.html#setpointdisplay',
+  'syms': { 'netatmo_thermostat.cache': { 'netatmo_thermostat.cache.TTLCache': ('cache.html#ttlcache', 'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.__init__': ( 'cache.html#ttlcache.__init__',
+                                                                                          'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.__len__': ( 'cache.html#ttlcache.__len__',
+                                                                                         'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache._grp': ( 'cache.html#ttlcache._grp',
+                                                                                      'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.get': ( 'cache.html#ttlcache.get',
+                                                                                     'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.invalidate': ( 'cache.html#ttlcache.invalidate',
+                                                                                            'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.set': ( 'cache.html#ttlcache.set',
+                                                                                     'netatmo_thermostat/cache.py'),
+                                          'netatmo_thermostat.cache.TTLCache.stats': ( 'cache.html#ttlcache.stats',
+                                                                                       'netatmo_thermostat/cache.py')},
+            'netatmo_thermostat.core': { 'netatmo_thermostat.core.AsyncThermostat': ( 'core.html#asyncthermostat',
                                                                                       'netatmo_thermostat/core.py'),
-                                         'netatmo_thermostat.core.TempChart': ('core.html#tempchart', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat.__aenter__': ( 'core.html#asyncthermostat.__aenter__',
+                                                                                                 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat.__aexit__': ( 'core.html#asyncthermostat.__aexit__',
+                                                                                                'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat.__init__': ( 'core.html#asyncthermostat.__init__',
+                                                                                               'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat._drive': ( 'core.html#asyncthermostat._drive',
+                                                                                             'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat.close': ( 'core.html#asyncthermostat.close',
+                                                                                            'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.AsyncThermostat.room_temperatures': ( 'core.html#asyncthermostat.room_temperatures',
+                                                                                                        'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat': ('core.html#thermostat', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat.__enter__': ( 'core.html#thermostat.__enter__',
+                                                                                           'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat.__exit__': ( 'core.html#thermostat.__exit__',
+                                                                                          'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat.__init__': ( 'core.html#thermostat.__init__',
                                                                                           'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._attempt_flow': ( 'core.html#thermostat._attempt_flow',
+                                                                                               'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._drive': ( 'core.html#thermostat._drive',
+                                                                                        'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._expiring': ( 'core.html#thermostat._expiring',
+                                                                                           'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._invalidate': ( 'core.html#thermostat._invalidate',
+                                                                                             'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat._refresh': ( 'core.html#thermostat._refresh',
                                                                                           'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._refresh_flow': ( 'core.html#thermostat._refresh_flow',
+                                                                                               'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat._request': ( 'core.html#thermostat._request',
                                                                                           'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._request_flow': ( 'core.html#thermostat._request_flow',
+                                                                                               'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._set_tokens': ( 'core.html#thermostat._set_tokens',
+                                                                                             'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat._ttl': ( 'core.html#thermostat._ttl',
+                                                                                      'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core.Thermostat.close': ( 'core.html#thermostat.close',
+                                                                                       'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat.createnewhomeschedule': ( 'core.html#thermostat.createnewhomeschedule',
                                                                                                        'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat.getmeasure': ( 'core.html#thermostat.getmeasure',
@@ -36,15 +83,550 @@ d = { 'settings': { 'branch': 'main',
                                                                                                     'netatmo_thermostat/core.py'),
                                          'netatmo_thermostat.core.Thermostat.synchomeschedule': ( 'core.html#thermostat.synchomeschedule',
                                                                                                   'netatmo_thermostat/core.py'),
-                                         'netatmo_thermostat.core.ThermostatWidget': ( 'core.html#thermostatwidget',
-                                                                                       'netatmo_thermostat/core.py'),
-                                         'netatmo_thermostat.core.setup_thermostat_widget': ( 'core.html#setup_thermostat_widget',
-                                                                                              'netatmo_thermostat/core.py'),
-                                         'netatmo_thermostat.core.to_chart': ('core.html#to_chart', 'netatmo_thermostat/core.py')},
-            'netatmo_thermostat.solar': { 'netatmo_thermostat.solar.SolaX': ('solar.html#solax', 'netatmo_thermostat/solar.py'),
+                                         'netatmo_thermostat.core.__getattr__': ('core.html#__getattr__', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core._err_msg': ('core.html#_err_msg', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core._heated_rooms': ('core.html#_heated_rooms', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core._rate_limited': ('core.html#_rate_limited', 'netatmo_thermostat/core.py'),
+                                         'netatmo_thermostat.core._room_temps': ('core.html#_room_temps', 'netatmo_thermostat/core.py')},
+            'netatmo_thermostat.history': { 'netatmo_thermostat.history.HistoryStore': ( 'history.html#historystore',
+                                                                                         'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.__init__': ( 'history.html#historystore.__init__',
+                                                                                                  'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.close': ( 'history.html#historystore.close',
+                                                                                               'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.fill': ( 'history.html#historystore.fill',
+                                                                                              'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.get': ( 'history.html#historystore.get',
+                                                                                             'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.measure': ( 'history.html#historystore.measure',
+                                                                                                 'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.put': ( 'history.html#historystore.put',
+                                                                                             'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.roommeasure': ( 'history.html#historystore.roommeasure',
+                                                                                                     'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.series': ( 'history.html#historystore.series',
+                                                                                                'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.HistoryStore.spans': ( 'history.html#historystore.spans',
+                                                                                               'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history._dedup': ('history.html#_dedup', 'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history._gaps': ('history.html#_gaps', 'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history._merge': ('history.html#_merge', 'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.abackfill': ( 'history.html#abackfill',
+                                                                                      'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.backfill': ( 'history.html#backfill',
+                                                                                     'netatmo_thermostat/history.py'),
+                                            'netatmo_thermostat.history.windows': ( 'history.html#windows',
+                                                                                    'netatmo_thermostat/history.py')},
+            'netatmo_thermostat.live': { 'netatmo_thermostat.live.Hub': ('live.html#hub', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Hub.__init__': ('live.html#hub.__init__', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Hub.__len__': ('live.html#hub.__len__', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Hub.publish': ('live.html#hub.publish', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Hub.subscribe': ('live.html#hub.subscribe', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.LiveSink': ('live.html#livesink', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller': ('live.html#poller', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.__init__': ( 'live.html#poller.__init__',
+                                                                                      'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller._fetch': ('live.html#poller._fetch', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller._run': ('live.html#poller._run', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.add': ('live.html#poller.add', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.poll': ('live.html#poller.poll', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.snapshot': ( 'live.html#poller.snapshot',
+                                                                                      'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.start': ('live.html#poller.start', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.Poller.stop': ('live.html#poller.stop', 'netatmo_thermostat/live.py'),
+                                         'netatmo_thermostat.live.setup_live': ('live.html#setup_live', 'netatmo_thermostat/live.py')},
+            'netatmo_thermostat.metrics': { 'netatmo_thermostat.metrics.Metrics': ('metrics.html#metrics', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.__init__': ( 'metrics.html#metrics.__init__',
+                                                                                             'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.inc': ( 'metrics.html#metrics.inc',
+                                                                                        'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.observe': ( 'metrics.html#metrics.observe',
+                                                                                            'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.render': ( 'metrics.html#metrics.render',
+                                                                                           'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.time': ( 'metrics.html#metrics.time',
+                                                                                         'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.Metrics.watch': ( 'metrics.html#metrics.watch',
+                                                                                          'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.MetricsMiddleware': ( 'metrics.html#metricsmiddleware',
+                                                                                              'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.MetricsMiddleware.__call__': ( 'metrics.html#metricsmiddleware.__call__',
+                                                                                                       'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.MetricsMiddleware.__init__': ( 'metrics.html#metricsmiddleware.__init__',
+                                                                                                       'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.MetricsMiddleware._serve': ( 'metrics.html#metricsmiddleware._serve',
+                                                                                                     'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics._ep': ('metrics.html#_ep', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics._esc': ('metrics.html#_esc', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics._key': ('metrics.html#_key', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics._labels': ('metrics.html#_labels', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics._record': ('metrics.html#_record', 'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.ainstrumented': ( 'metrics.html#ainstrumented',
+                                                                                          'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.instrumented': ( 'metrics.html#instrumented',
+                                                                                         'netatmo_thermostat/metrics.py'),
+                                            'netatmo_thermostat.metrics.setup_metrics_route': ( 'metrics.html#setup_metrics_route',
+                                                                                                'netatmo_thermostat/metrics.py')},
+            'netatmo_thermostat.models': { 'netatmo_thermostat.models.Home': ('models.html#home', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.HomeStatus': ( 'models.html#homestatus',
+                                                                                     'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.HomesData': ('models.html#homesdata', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model': ('models.html#model', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__contains__': ( 'models.html#model.__contains__',
+                                                                                             'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__eq__': ( 'models.html#model.__eq__',
+                                                                                       'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__getattr__': ( 'models.html#model.__getattr__',
+                                                                                            'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__getitem__': ( 'models.html#model.__getitem__',
+                                                                                            'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__init__': ( 'models.html#model.__init__',
+                                                                                         'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__iter__': ( 'models.html#model.__iter__',
+                                                                                         'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__len__': ( 'models.html#model.__len__',
+                                                                                        'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.__repr__': ( 'models.html#model.__repr__',
+                                                                                         'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.get': ('models.html#model.get', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Model.to_dict': ( 'models.html#model.to_dict',
+                                                                                        'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Module': ('models.html#module', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Realtime': ('models.html#realtime', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.RealtimeResult': ( 'models.html#realtimeresult',
+                                                                                         'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Room': ('models.html#room', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.Schedule': ('models.html#schedule', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models._wrap': ('models.html#_wrap', 'netatmo_thermostat/models.py'),
+                                           'netatmo_thermostat.models.decode': ('models.html#decode', 'netatmo_thermostat/models.py')},
+            'netatmo_thermostat.ratelimit': { 'netatmo_thermostat.ratelimit.RateLimiter': ( 'ratelimit.html#ratelimiter',
+                                                                                            'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter.__init__': ( 'ratelimit.html#ratelimiter.__init__',
+                                                                                                     'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter._buckets': ( 'ratelimit.html#ratelimiter._buckets',
+                                                                                                     'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter._poll': ( 'ratelimit.html#ratelimiter._poll',
+                                                                                                  'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter._wait': ( 'ratelimit.html#ratelimiter._wait',
+                                                                                                  'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter.acquire': ( 'ratelimit.html#ratelimiter.acquire',
+                                                                                                    'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter.headroom': ( 'ratelimit.html#ratelimiter.headroom',
+                                                                                                     'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.RateLimiter.pause': ( 'ratelimit.html#ratelimiter.pause',
+                                                                                                  'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.TokenBucket': ( 'ratelimit.html#tokenbucket',
+                                                                                            'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.TokenBucket.__init__': ( 'ratelimit.html#tokenbucket.__init__',
+                                                                                                     'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.TokenBucket._fill': ( 'ratelimit.html#tokenbucket._fill',
+                                                                                                  'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.TokenBucket.take': ( 'ratelimit.html#tokenbucket.take',
+                                                                                                 'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.TokenBucket.wait': ( 'ratelimit.html#tokenbucket.wait',
+                                                                                                 'netatmo_thermostat/ratelimit.py'),
+                                              'netatmo_thermostat.ratelimit.retry_after': ( 'ratelimit.html#retry_after',
+                                                                                            'netatmo_thermostat/ratelimit.py')},
+            'netatmo_thermostat.render': { 'netatmo_thermostat.render.FragmentCache': ( 'render.html#fragmentcache',
+                                                                                        'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.FragmentCache.__call__': ( 'render.html#fragmentcache.__call__',
+                                                                                                 'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.FragmentCache.__init__': ( 'render.html#fragmentcache.__init__',
+                                                                                                 'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.FragmentCache.__len__': ( 'render.html#fragmentcache.__len__',
+                                                                                                'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.FragmentCache.stats': ( 'render.html#fragmentcache.stats',
+                                                                                              'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render._etags': ('render.html#_etags', 'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render._partial': ('render.html#_partial', 'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render._plain': ('render.html#_plain', 'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.conditional': ( 'render.html#conditional',
+                                                                                      'netatmo_thermostat/render.py'),
+                                           'netatmo_thermostat.render.data_key': ('render.html#data_key', 'netatmo_thermostat/render.py')},
+            'netatmo_thermostat.resilience': { 'netatmo_thermostat.resilience.APIError': ( 'resilience.html#apierror',
+                                                                                           'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.APIError.__init__': ( 'resilience.html#apierror.__init__',
+                                                                                                    'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.AuthError': ( 'resilience.html#autherror',
+                                                                                            'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.Breakers': ( 'resilience.html#breakers',
+                                                                                           'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.Breakers.__init__': ( 'resilience.html#breakers.__init__',
+                                                                                                    'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.Breakers.__missing__': ( 'resilience.html#breakers.__missing__',
+                                                                                                       'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.Breakers.states': ( 'resilience.html#breakers.states',
+                                                                                                  'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker': ( 'resilience.html#circuitbreaker',
+                                                                                                 'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker.__init__': ( 'resilience.html#circuitbreaker.__init__',
+                                                                                                          'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker.allow': ( 'resilience.html#circuitbreaker.allow',
+                                                                                                       'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker.failure': ( 'resilience.html#circuitbreaker.failure',
+                                                                                                         'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker.state': ( 'resilience.html#circuitbreaker.state',
+                                                                                                       'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitBreaker.success': ( 'resilience.html#circuitbreaker.success',
+                                                                                                         'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.CircuitOpen': ( 'resilience.html#circuitopen',
+                                                                                              'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.RateLimited': ( 'resilience.html#ratelimited',
+                                                                                              'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.TransientError': ( 'resilience.html#transienterror',
+                                                                                                 'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.TransientError.__init__': ( 'resilience.html#transienterror.__init__',
+                                                                                                          'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.backoff': ( 'resilience.html#backoff',
+                                                                                          'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.checked': ( 'resilience.html#checked',
+                                                                                          'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.parse_json': ( 'resilience.html#parse_json',
+                                                                                             'netatmo_thermostat/resilience.py'),
+                                               'netatmo_thermostat.resilience.retrying': ( 'resilience.html#retrying',
+                                                                                           'netatmo_thermostat/resilience.py')},
+            'netatmo_thermostat.schedule': { 'netatmo_thermostat.schedule.WeekSchedule': ( 'schedule.html#weekschedule',
+                                                                                           'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.__init__': ( 'schedule.html#weekschedule.__init__',
+                                                                                                    'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.__repr__': ( 'schedule.html#weekschedule.__repr__',
+                                                                                                    'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule._check_zone': ( 'schedule.html#weekschedule._check_zone',
+                                                                                                       'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.diff': ( 'schedule.html#weekschedule.diff',
+                                                                                                'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.from_home': ( 'schedule.html#weekschedule.from_home',
+                                                                                                     'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.from_schedule': ( 'schedule.html#weekschedule.from_schedule',
+                                                                                                         'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.next_change': ( 'schedule.html#weekschedule.next_change',
+                                                                                                       'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.remove_change': ( 'schedule.html#weekschedule.remove_change',
+                                                                                                         'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.set_temp': ( 'schedule.html#weekschedule.set_temp',
+                                                                                                    'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.set_zone': ( 'schedule.html#weekschedule.set_zone',
+                                                                                                    'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.state': ( 'schedule.html#weekschedule.state',
+                                                                                                 'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.sync': ( 'schedule.html#weekschedule.sync',
+                                                                                                'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.temp_at': ( 'schedule.html#weekschedule.temp_at',
+                                                                                                   'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.to_api': ( 'schedule.html#weekschedule.to_api',
+                                                                                                  'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.validate': ( 'schedule.html#weekschedule.validate',
+                                                                                                    'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.zone_at': ( 'schedule.html#weekschedule.zone_at',
+                                                                                                   'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.WeekSchedule.zone_at_offset': ( 'schedule.html#weekschedule.zone_at_offset',
+                                                                                                          'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule._check_temp': ( 'schedule.html#_check_temp',
+                                                                                          'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule._zone_temps': ( 'schedule.html#_zone_temps',
+                                                                                          'netatmo_thermostat/schedule.py'),
+                                             'netatmo_thermostat.schedule.minute_of_week': ( 'schedule.html#minute_of_week',
+                                                                                             'netatmo_thermostat/schedule.py')},
+            'netatmo_thermostat.series': { 'netatmo_thermostat.series.Measure': ('series.html#measure', 'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.Measure.__getitem__': ( 'series.html#measure.__getitem__',
+                                                                                              'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.Measure.__init__': ( 'series.html#measure.__init__',
+                                                                                           'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.Measure.__len__': ( 'series.html#measure.__len__',
+                                                                                          'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.Measure.__repr__': ( 'series.html#measure.__repr__',
+                                                                                           'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series._measure_table': ( 'series.html#_measure_table',
+                                                                                         'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.lttb': ('series.html#lttb', 'netatmo_thermostat/series.py'),
+                                           'netatmo_thermostat.series.measure_arrays': ( 'series.html#measure_arrays',
+                                                                                         'netatmo_thermostat/series.py')},
+            'netatmo_thermostat.shared': { 'netatmo_thermostat.shared.Leader': ('shared.html#leader', 'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.Leader.__call__': ( 'shared.html#leader.__call__',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.Leader.__init__': ( 'shared.html#leader.__init__',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.Leader.release': ( 'shared.html#leader.release',
+                                                                                         'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState': ( 'shared.html#sqlitestate',
+                                                                                      'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.__init__': ( 'shared.html#sqlitestate.__init__',
+                                                                                               'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState._run': ( 'shared.html#sqlitestate._run',
+                                                                                           'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState._write': ( 'shared.html#sqlitestate._write',
+                                                                                             'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.acquire': ( 'shared.html#sqlitestate.acquire',
+                                                                                              'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.close': ( 'shared.html#sqlitestate.close',
+                                                                                            'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.delete': ( 'shared.html#sqlitestate.delete',
+                                                                                             'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.get': ( 'shared.html#sqlitestate.get',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.keys': ( 'shared.html#sqlitestate.keys',
+                                                                                           'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.release': ( 'shared.html#sqlitestate.release',
+                                                                                              'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SQLiteState.set': ( 'shared.html#sqlitestate.set',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache': ( 'shared.html#sharedcache',
+                                                                                      'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache.__init__': ( 'shared.html#sharedcache.__init__',
+                                                                                               'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache.__len__': ( 'shared.html#sharedcache.__len__',
+                                                                                              'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache.get': ( 'shared.html#sharedcache.get',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache.invalidate': ( 'shared.html#sharedcache.invalidate',
+                                                                                                 'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedCache.set': ( 'shared.html#sharedcache.set',
+                                                                                          'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens': ( 'shared.html#sharedtokens',
+                                                                                       'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens.__init__': ( 'shared.html#sharedtokens.__init__',
+                                                                                                'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens.load': ( 'shared.html#sharedtokens.load',
+                                                                                            'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens.save': ( 'shared.html#sharedtokens.save',
+                                                                                            'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens.try_lock': ( 'shared.html#sharedtokens.try_lock',
+                                                                                                'netatmo_thermostat/shared.py'),
+                                           'netatmo_thermostat.shared.SharedTokens.unlock': ( 'shared.html#sharedtokens.unlock',
+                                                                                              'netatmo_thermostat/shared.py')},
+            'netatmo_thermostat.solar': { 'netatmo_thermostat.solar.AsyncSolaX': ('solar.html#asyncsolax', 'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX.__aenter__': ( 'solar.html#asyncsolax.__aenter__',
+                                                                                              'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX.__aexit__': ( 'solar.html#asyncsolax.__aexit__',
+                                                                                             'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX.__init__': ( 'solar.html#asyncsolax.__init__',
+                                                                                            'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX._drive': ( 'solar.html#asyncsolax._drive',
+                                                                                          'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX._spawn': ( 'solar.html#asyncsolax._spawn',
+                                                                                          'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.AsyncSolaX.close': ( 'solar.html#asyncsolax.close',
+                                                                                         'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX': ('solar.html#solax', 'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX.__enter__': ( 'solar.html#solax.__enter__',
+                                                                                        'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX.__exit__': ( 'solar.html#solax.__exit__',
+                                                                                       'netatmo_thermostat/solar.py'),
                                           'netatmo_thermostat.solar.SolaX.__init__': ( 'solar.html#solax.__init__',
                                                                                        'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._drive': ( 'solar.html#solax._drive',
+                                                                                     'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._expiry': ( 'solar.html#solax._expiry',
+                                                                                      'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._fetch_flow': ( 'solar.html#solax._fetch_flow',
+                                                                                          'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._realtime_attempt': ( 'solar.html#solax._realtime_attempt',
+                                                                                                'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._realtime_flow': ( 'solar.html#solax._realtime_flow',
+                                                                                             'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._revalidate': ( 'solar.html#solax._revalidate',
+                                                                                          'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX._spawn': ( 'solar.html#solax._spawn',
+                                                                                     'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar.SolaX.close': ('solar.html#solax.close', 'netatmo_thermostat/solar.py'),
                                           'netatmo_thermostat.solar.SolaX.getRealtimeInfo': ( 'solar.html#solax.getrealtimeinfo',
                                                                                               'netatmo_thermostat/solar.py'),
-                                          'netatmo_thermostat.solar.SolarWidget': ( 'solar.html#solarwidget',
-                                                                                    'netatmo_thermostat/solar.py')}}}
+                                          'netatmo_thermostat.solar.__getattr__': ('solar.html#__getattr__', 'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar._rate_limited': ( 'solar.html#_rate_limited',
+                                                                                      'netatmo_thermostat/solar.py'),
+                                          'netatmo_thermostat.solar._upload_ts': ('solar.html#_upload_ts', 'netatmo_thermostat/solar.py')},
+            'netatmo_thermostat.standin': { 'netatmo_thermostat.standin.Standin': ('standin.html#standin', 'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin.__call__': ( 'standin.html#standin.__call__',
+                                                                                             'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin.__init__': ( 'standin.html#standin.__init__',
+                                                                                             'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._delay': ( 'standin.html#standin._delay',
+                                                                                           'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._getmeasure': ( 'standin.html#standin._getmeasure',
+                                                                                                'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._getroommeasure': ( 'standin.html#standin._getroommeasure',
+                                                                                                    'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._homesdata': ( 'standin.html#standin._homesdata',
+                                                                                               'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._homestatus': ( 'standin.html#standin._homestatus',
+                                                                                                'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._measure': ( 'standin.html#standin._measure',
+                                                                                             'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._room_ids': ( 'standin.html#standin._room_ids',
+                                                                                              'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._schedule': ( 'standin.html#standin._schedule',
+                                                                                              'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._setpoint': ( 'standin.html#standin._setpoint',
+                                                                                              'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._setroomthermpoint': ( 'standin.html#standin._setroomthermpoint',
+                                                                                                       'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin._synchomeschedule': ( 'standin.html#standin._synchomeschedule',
+                                                                                                      'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin.netatmo': ( 'standin.html#standin.netatmo',
+                                                                                            'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin.realtime': ( 'standin.html#standin.realtime',
+                                                                                             'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.Standin.token': ( 'standin.html#standin.token',
+                                                                                          'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin._per': ('standin.html#_per', 'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin._temp': ('standin.html#_temp', 'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin._values': ('standin.html#_values', 'netatmo_thermostat/standin.py'),
+                                            'netatmo_thermostat.standin.standin_clients': ( 'standin.html#standin_clients',
+                                                                                            'netatmo_thermostat/standin.py')},
+            'netatmo_thermostat.surplus': { 'netatmo_thermostat.surplus.SurplusController': ( 'surplus.html#surpluscontroller',
+                                                                                              'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController.__init__': ( 'surplus.html#surpluscontroller.__init__',
+                                                                                                       'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController.__repr__': ( 'surplus.html#surpluscontroller.__repr__',
+                                                                                                       'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController._held': ( 'surplus.html#surpluscontroller._held',
+                                                                                                    'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController._wanted': ( 'surplus.html#surpluscontroller._wanted',
+                                                                                                      'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController._write': ( 'surplus.html#surpluscontroller._write',
+                                                                                                     'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.SurplusController.update': ( 'surplus.html#surpluscontroller.update',
+                                                                                                     'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.replay': ('surplus.html#replay', 'netatmo_thermostat/surplus.py'),
+                                            'netatmo_thermostat.surplus.surplus_step': ( 'surplus.html#surplus_step',
+                                                                                         'netatmo_thermostat/surplus.py')},
+            'netatmo_thermostat.telemetry': { 'netatmo_thermostat.telemetry.SolarLog': ( 'telemetry.html#solarlog',
+                                                                                         'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.__init__': ( 'telemetry.html#solarlog.__init__',
+                                                                                                  'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.__len__': ( 'telemetry.html#solarlog.__len__',
+                                                                                                 'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.__repr__': ( 'telemetry.html#solarlog.__repr__',
+                                                                                                  'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.append': ( 'telemetry.html#solarlog.append',
+                                                                                                'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.arrays': ( 'telemetry.html#solarlog.arrays',
+                                                                                                'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.daily': ( 'telemetry.html#solarlog.daily',
+                                                                                               'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.flush': ( 'telemetry.html#solarlog.flush',
+                                                                                               'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.poll': ( 'telemetry.html#solarlog.poll',
+                                                                                              'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.record': ( 'telemetry.html#solarlog.record',
+                                                                                                'netatmo_thermostat/telemetry.py'),
+                                              'netatmo_thermostat.telemetry.SolarLog.sync': ( 'telemetry.html#solarlog.sync',
+                                                                                              'netatmo_thermostat/telemetry.py')},
+            'netatmo_thermostat.thermal': { 'netatmo_thermostat.thermal.ThermalModel': ( 'thermal.html#thermalmodel',
+                                                                                         'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.__init__': ( 'thermal.html#thermalmodel.__init__',
+                                                                                                  'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.__repr__': ( 'thermal.html#thermalmodel.__repr__',
+                                                                                                  'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.coef': ( 'thermal.html#thermalmodel.coef',
+                                                                                              'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.preheat': ( 'thermal.html#thermalmodel.preheat',
+                                                                                                 'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.rate': ( 'thermal.html#thermalmodel.rate',
+                                                                                              'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.runtime_per_degree': ( 'thermal.html#thermalmodel.runtime_per_degree',
+                                                                                                            'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.ThermalModel.update': ( 'thermal.html#thermalmodel.update',
+                                                                                                'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.align': ('thermal.html#align', 'netatmo_thermostat/thermal.py'),
+                                            'netatmo_thermostat.thermal.thermal_history': ( 'thermal.html#thermal_history',
+                                                                                            'netatmo_thermostat/thermal.py')},
+            'netatmo_thermostat.tokens': { 'netatmo_thermostat.tokens.TokenStore': ( 'tokens.html#tokenstore',
+                                                                                     'netatmo_thermostat/tokens.py'),
+                                           'netatmo_thermostat.tokens.TokenStore.__init__': ( 'tokens.html#tokenstore.__init__',
+                                                                                              'netatmo_thermostat/tokens.py'),
+                                           'netatmo_thermostat.tokens.TokenStore.load': ( 'tokens.html#tokenstore.load',
+                                                                                          'netatmo_thermostat/tokens.py'),
+                                           'netatmo_thermostat.tokens.TokenStore.save': ( 'tokens.html#tokenstore.save',
+                                                                                          'netatmo_thermostat/tokens.py'),
+                                           'netatmo_thermostat.tokens.TokenStore.try_lock': ( 'tokens.html#tokenstore.try_lock',
+                                                                                              'netatmo_thermostat/tokens.py'),
+                                           'netatmo_thermostat.tokens.TokenStore.unlock': ( 'tokens.html#tokenstore.unlock',
+                                                                                            'netatmo_thermostat/tokens.py')},
+            'netatmo_thermostat.transport': { 'netatmo_thermostat.transport.adrive': ( 'transport.html#adrive',
+                                                                                       'netatmo_thermostat/transport.py'),
+                                              'netatmo_thermostat.transport.drive': ( 'transport.html#drive',
+                                                                                      'netatmo_thermostat/transport.py'),
+                                              'netatmo_thermostat.transport.make_async_client': ( 'transport.html#make_async_client',
+                                                                                                  'netatmo_thermostat/transport.py'),
+                                              'netatmo_thermostat.transport.make_client': ( 'transport.html#make_client',
+                                                                                            'netatmo_thermostat/transport.py')},
+            'netatmo_thermostat.widgets': { 'netatmo_thermostat.widgets.AsyncSolarWidget': ( 'widgets.html#asyncsolarwidget',
+                                                                                             'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.AsyncThermostatGrid': ( 'widgets.html#asyncthermostatgrid',
+                                                                                                'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.AsyncThermostatWidget': ( 'widgets.html#asyncthermostatwidget',
+                                                                                                  'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.ControlBtn': ( 'widgets.html#controlbtn',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.LazyWidget': ( 'widgets.html#lazywidget',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.MeasuredTemp': ( 'widgets.html#measuredtemp',
+                                                                                         'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.SetpointDisplay': ( 'widgets.html#setpointdisplay',
+                                                                                            'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.Skeleton': ( 'widgets.html#skeleton',
+                                                                                     'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.SolarCard': ( 'widgets.html#solarcard',
+                                                                                      'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.SolarChart': ( 'widgets.html#solarchart',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.SolarWidget': ( 'widgets.html#solarwidget',
+                                                                                        'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.TempChart': ( 'widgets.html#tempchart',
+                                                                                      'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.ThermostatCard': ( 'widgets.html#thermostatcard',
+                                                                                           'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.ThermostatGrid': ( 'widgets.html#thermostatgrid',
+                                                                                           'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.ThermostatWidget': ( 'widgets.html#thermostatwidget',
+                                                                                             'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._agrid_data': ( 'widgets.html#_agrid_data',
+                                                                                        'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._aroom_data': ( 'widgets.html#_aroom_data',
+                                                                                        'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._fetch': ('widgets.html#_fetch', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._find_room': ( 'widgets.html#_find_room',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._grid': ('widgets.html#_grid', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._grid_data': ( 'widgets.html#_grid_data',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._pairs': ('widgets.html#_pairs', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._retry': ('widgets.html#_retry', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._rid': ('widgets.html#_rid', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._room_data': ( 'widgets.html#_room_data',
+                                                                                       'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._room_fragments': ( 'widgets.html#_room_fragments',
+                                                                                            'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._room_names': ( 'widgets.html#_room_names',
+                                                                                        'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._solar_hist': ( 'widgets.html#_solar_hist',
+                                                                                        'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._timed': ('widgets.html#_timed', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets._watch': ('widgets.html#_watch', 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.setpoint_writes': ( 'widgets.html#setpoint_writes',
+                                                                                            'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.setup_setpoint_route': ( 'widgets.html#setup_setpoint_route',
+                                                                                                 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.setup_solar_widget': ( 'widgets.html#setup_solar_widget',
+                                                                                               'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.setup_thermostat_grid': ( 'widgets.html#setup_thermostat_grid',
+                                                                                                  'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.setup_thermostat_widget': ( 'widgets.html#setup_thermostat_widget',
+                                                                                                    'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.thermostat_fragments': ( 'widgets.html#thermostat_fragments',
+                                                                                                 'netatmo_thermostat/widgets.py'),
+                                            'netatmo_thermostat.widgets.to_chart': ( 'widgets.html#to_chart',
+                                                                                     'netatmo_thermostat/widgets.py')},
+            'netatmo_thermostat.writes': { 'netatmo_thermostat.writes.WriteCoalescer': ( 'writes.html#writecoalescer',
+                                                                                         'netatmo_thermostat/writes.py'),
+                                           'netatmo_thermostat.writes.WriteCoalescer.__init__': ( 'writes.html#writecoalescer.__init__',
+                                                                                                  'netatmo_thermostat/writes.py'),
+                                           'netatmo_thermostat.writes.WriteCoalescer._flush': ( 'writes.html#writecoalescer._flush',
+                                                                                                'netatmo_thermostat/writes.py'),
+                                           'netatmo_thermostat.writes.WriteCoalescer._start': ( 'writes.html#writecoalescer._start',
+                                                                                                'netatmo_thermostat/writes.py'),
+                                           'netatmo_thermostat.writes.WriteCoalescer.flush': ( 'writes.html#writecoalescer.flush',
+                                                                                               'netatmo_thermostat/writes.py'),
+                                           'netatmo_thermostat.writes.WriteCoalescer.submit': ( 'writes.html#writecoalescer.submit',
+                                                                                                'netatmo_thermostat/writes.py')}}}
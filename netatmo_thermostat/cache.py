@@ -0,0 +1,55 @@
+"""Small in-memory caches used by the API clients"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/03_cache.ipynb.
+
+# %% auto 0
+__all__ = ['TTLCache']
+
+# %% ../nbs/03_cache.ipynb 2
+import threading
+from time import monotonic
+from collections import OrderedDict, Counter
+
+# %% ../nbs/03_cache.ipynb 5
+class TTLCache:
+    "LRU-bounded cache whose entries expire `ttl` seconds after being set"
+    def __init__(self, maxsize=512, clock=monotonic):
+        self.maxsize,self.clock = maxsize,clock
+        self.data,self.lock = OrderedDict(),threading.Lock()
+        self.hits,self.misses = Counter(),Counter()
+
+    def __len__(self): return len(self.data)
+    def _grp(self, key): return key[0] if isinstance(key, tuple) else key
+
+    def get(self, key, default=None):
+        "Value for `key` if present and not expired, else `default`"
+        with self.lock:
+            v = self.data.get(key)
+            if v is None or v[1] <= self.clock():
+                if v is not None: del self.data[key]
+                self.misses[self._grp(key)] += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits[self._grp(key)] += 1
+            return v[0]
+
+    def set(self, key, value, ttl):
+        "Store `value` under `key` for `ttl` seconds, evicting the least recently used entries past `maxsize`"
+        with self.lock:
+            self.data[key] = (value, self.clock()+ttl)
+            self.data.move_to_end(key)
+            while len(self.data) > self.maxsize: self.data.popitem(last=False)
+
+    def invalidate(self, pred=None):
+        "Drop entries whose key matches `pred` (all if `None`), returning how many were dropped"
+        with self.lock:
+            ks = [k for k in self.data if pred is None or pred(k)]
+            for k in ks: del self.data[k]
+        return len(ks)
+
+    @property
+    def stats(self):
+        "Hit/miss counts overall and per key group"
+        h,m = sum(self.hits.values()),sum(self.misses.values())
+        grps = {g: dict(hits=self.hits[g], misses=self.misses[g]) for g in {**self.hits, **self.misses}}
+        return dict(hits=h, misses=m, hit_ratio=h/(h+m) if h+m else 0., size=len(self), groups=grps)
@@ -1,75 +1,206 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/00_core.ipynb.
 
 # %% auto 0
-__all__ = ['Thermostat', 'ControlBtn', 'SetpointDisplay', 'to_chart', 'TempChart', 'ThermostatWidget', 'setup_thermostat_widget']
+__all__ = ['scale_secs', 'cache_ttls', 'cache_invalidates', 'user_budgets', 'endpoint_budgets', 'request_priority', 'Thermostat',
+           'AsyncThermostat', 'ControlBtn', 'SetpointDisplay', 'MeasuredTemp', 'to_chart', 'TempChart', 'room_history',
+           'ThermostatCard', 'thermostat_fragments', 'ThermostatWidget', 'ThermostatGrid', 'AsyncThermostatWidget',
+           'AsyncThermostatGrid', 'setpoint_writes', 'setup_setpoint_route', 'setup_thermostat_widget',
+           'setup_thermostat_grid']
 
 # %% ../nbs/00_core.ipynb 2
 import os
-import json 
+import threading
 
 from time import time
-from fastcore.utils import patch
-from fastcore.xtras import dict2obj
+from pathlib import Path
+from fastcore.basics import patch
 
-from fasthtml.common import *
-from monsterui.all import *
-
-from httpx import get as xget, post as xpost
+from .transport import make_client, make_async_client, drive, adrive
+from .cache import TTLCache
+from .ratelimit import RateLimiter, retry_after
+from .tokens import TokenStore
+from .resilience import APIError, TransientError, RateLimited, AuthError, CircuitOpen, Breakers, checked, parse_json, retrying
+from .models import decode
+from .metrics import instrumented, ainstrumented
 
 # %% ../nbs/00_core.ipynb 14
+scale_secs = {'30min': 1800, '1hour': 3600, '3hours': 10800, '1day': 86400, '1week': 604800, '1month': 2592000}
+cache_ttls = {'homesdata': 3600, 'homestatus': 60, 'getroommeasure': scale_secs, 'getmeasure': scale_secs}
+cache_invalidates = {'setroomthermpoint': ['homestatus'], 'setthermmode': ['homestatus'],
+                     'switchhomeschedule': ['homestatus', 'homesdata'], 'synchomeschedule': ['homestatus', 'homesdata'],
+                     'createnewhomeschedule': ['homesdata']}
+
+# %% ../nbs/00_core.ipynb 15
+user_budgets = [(50, 10), (500, 3600)]
+endpoint_budgets = {'getroommeasure': [(200, 3600)], 'getmeasure': [(100, 3600)]}
+request_priority = {'setroomthermpoint': 0, 'setthermmode': 0, 'switchhomeschedule': 0, 'synchomeschedule': 0,
+                    'createnewhomeschedule': 0, 'getroommeasure': 2, 'getmeasure': 2}
+
+def _rate_limited(r):
+    "Whether `r` says the user's request quota is used up"
+    if r.status_code == 429: return True
+    if r.status_code != 403: return False
+    try: return r.json()['error']['code'] == 26
+    except (ValueError, KeyError, TypeError): return False
+
+# %% ../nbs/00_core.ipynb 16
 class Thermostat:
     base = 'https://api.netatmo.com'
+    refresh_margin = 300 # Refresh the access token this many seconds before it expires
+    refresh_poll = 0.05 # Seconds between checks while another caller is refreshing
     
-    def __init__(self, client_id=None, client_secret=None, access_token=None, refresh_token=None):
+    def __init__(self, client_id=None, client_secret=None, access_token=None, refresh_token=None, client=None,
+                 cache=True, # `True` for a default `TTLCache`, a `TTLCache` (or `SharedCache`) to share one, or `False` to disable
+                 ttls=None, # Per-endpoint TTL overrides, merged into `cache_ttls`
+                 limiter=True, # `True` for a `RateLimiter` with Netatmo's quotas, a `RateLimiter` to share one, or `False` to disable
+                 retries=3, # Retries for 5xx responses, timeouts, malformed JSON and rate limits
+                 backoff=0.5, # Base of the exponential backoff between retries, in seconds
+                 breakers=None, # `Breakers` to share, else one breaker per endpoint opening after 5 consecutive failures
+                 stale=True, # Whether reads fall back to their last successful result while the endpoint is failing
+                 tokens=None, # `TokenStore` (or path to one, or `SharedTokens`) persisting rotated tokens; stored tokens take precedence
+                 metrics=None): # `Metrics` (or anything with its `inc` and `observe`) recording requests, token refreshes and cache hits
         self.client_id = client_id or os.getenv('CLIENT_ID')
         self.client_secret = client_secret or os.getenv('CLIENT_SECRET')
         self.access_token = access_token or os.getenv('ACCESS_TOKEN')
         self.refresh_token = refresh_token or os.getenv('REFRESH_TOKEN')
+        self.expires_at,self.refresh_lock = None,threading.Lock()
+        self.tokens = TokenStore(tokens) if isinstance(tokens, (str, Path)) else tokens
+        if self.tokens is not None and (d := self.tokens.load()): self._set_tokens(d)
+        self.client = client or make_client()
+        self.cache = TTLCache() if cache is True else None if cache is False else cache
+        self.ttls = {**cache_ttls, **(ttls or {})}
+        self.limiter = RateLimiter(user_budgets, endpoint_budgets) if limiter is True else limiter or None
+        self.retries,self.backoff = retries,backoff
+        self.breakers = Breakers() if breakers is None else breakers
+        self.last = TTLCache(256) if stale else None
+        self.metrics = metrics
+        if metrics is not None and self.cache is not None: metrics.watch(self.cache, 'netatmo')
 
-# %% ../nbs/00_core.ipynb 16
-@patch
-def _refresh(self:Thermostat):
-    r = xpost(f'{self.base}/oauth2/token', data={
-        'grant_type': 'refresh_token',
-        'refresh_token': self.refresh_token,
-        'client_id': self.client_id,
-        'client_secret': self.client_secret
-    })
-    d = r.json()
-    self.access_token, self.refresh_token = d['access_token'], d['refresh_token']
-    return d
+    def close(self): self.client.close()
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
 
 # %% ../nbs/00_core.ipynb 18
 @patch
-def _request(self:Thermostat,
+def _set_tokens(self:Thermostat, d):
+    self.access_token,self.refresh_token,self.expires_at = d['access_token'],d['refresh_token'],d.get('expires_at')
+
+@patch
+def _expiring(self:Thermostat): return self.expires_at is not None and time() >= self.expires_at-self.refresh_margin
+
+@patch
+def _refresh_flow(self:Thermostat, seen=None):
+    "Refresh the tokens unless another caller already replaced the access token `seen`, one refresh at a time across threads and processes"
+    while not self.refresh_lock.acquire(blocking=False): yield self.refresh_poll
+    try:
+        while self.tokens is not None and not self.tokens.try_lock(): yield self.refresh_poll
+        try:
+            if self.tokens is not None and (d := self.tokens.load()) and d['refresh_token'] != self.refresh_token: self._set_tokens(d)
+            if seen is not None and self.access_token != seen and not self._expiring(): return
+            if self.metrics is not None: self.metrics.inc('netatmo_token_refreshes_total')
+            r = yield from checked(self.client.build_request('post', f'{self.base}/oauth2/token', data={
+                'grant_type': 'refresh_token',
+                'refresh_token': self.refresh_token,
+                'client_id': self.client_id,
+                'client_secret': self.client_secret
+            }))
+            d = parse_json(r)
+            if not r.is_success: raise AuthError(f'token refresh failed: {_err_msg(d)}', r.status_code)
+            self._set_tokens({**d, 'expires_at': time()+d.get('expires_in', 10800)})
+            if self.tokens is not None: self.tokens.save(dict(access_token=self.access_token, refresh_token=self.refresh_token, expires_at=self.expires_at))
+            return d
+        finally:
+            if self.tokens is not None: self.tokens.unlock()
+    finally: self.refresh_lock.release()
+
+@patch
+def _drive(self:Thermostat, flow):
+    return drive(flow, self.client.send if self.metrics is None else instrumented(self.client.send, self.metrics, 'netatmo'))
+
+@patch
+def _refresh(self:Thermostat): return self._drive(self._refresh_flow())
+
+# %% ../nbs/00_core.ipynb 20
+@patch
+def _attempt_flow(self:Thermostat, endpoint, method, **kwargs):
+    "One attempt at calling `endpoint`, refreshing the access token ahead of expiry and at most once on auth errors"
+    url = f'{self.base}/api/{endpoint}'
+    headers = kwargs.pop('headers', {})
+    for refreshed in (False, True):
+        if self._expiring(): yield from self._refresh_flow(self.access_token)
+        if self.limiter is not None: yield from self.limiter.acquire(endpoint, request_priority.get(endpoint, 1))
+        token = self.access_token
+        headers['Authorization'] = f'Bearer {token}'
+        r = yield from checked(self.client.build_request(method, url, headers=headers, **kwargs))
+        if _rate_limited(r):
+            w = retry_after(r)
+            if self.limiter is not None: self.limiter.pause(w); w = 0
+            raise RateLimited(f'{endpoint}: rate limited', r.status_code, wait=w)
+        if r.status_code not in (401, 403) or refreshed: break
+        yield from self._refresh_flow(token)
+    rj = parse_json(r)
+    if not r.is_success:
+        raise (AuthError if r.status_code in (401, 403) else APIError)(f'{endpoint}: {_err_msg(rj)}', r.status_code)
+    return decode(endpoint, rj.get('body', rj))
+
+def _err_msg(rj):
+    e = rj.get('error') if isinstance(rj, dict) else None
+    return e.get('message', e) if isinstance(e, dict) else e
+
+@patch
+def _request_flow(self:Thermostat,
     endpoint:str, # the endpoint to query
     method='post', # the http method,
     **kwargs
 ): # extra kwargs
-    "Request a Netatmo API endpoint with auto-refresh on expired token."
+    "Request flow for a Netatmo API endpoint with caching, rate limiting, retries and auto-refresh on expired token."
 
-    url = f'{self.base}/api/{endpoint}'
-    headers = kwargs.pop('headers', {})
-    headers['Authorization'] = f'Bearer {self.access_token}'
-    
-    r = xpost(url, headers=headers, **kwargs) if method == 'post' else xget(url, headers=headers, **kwargs)
-    if r.status_code in (401, 403): 
-        self._refresh()
-        return self._request(endpoint, method, **kwargs)
-    rj = r.json()
-    return dict2obj(rj.get('body', rj))
+    data = kwargs.get('data') or kwargs.get('json') or {}
+    ttl = self._ttl(endpoint, data)
+    key = (endpoint, *sorted(data.items()))
+    if ttl and (hit := self.cache.get(key)) is not None: return hit
+
+    read = endpoint not in cache_invalidates
+    try: res = yield from retrying(lambda: self._attempt_flow(endpoint, method, **kwargs), self.retries, self.breakers[endpoint], self.backoff)
+    except (TransientError, CircuitOpen):
+        if not read or self.last is None or (res := self.last.get(key)) is None: raise
+        return res
+    if read and self.last is not None: self.last.set(key, res, float('inf'))
+    if self.cache is not None:
+        if ttl: self.cache.set(key, res, ttl)
+        self._invalidate(endpoint, data)
+    return res
+
+@patch
+def _request(self:Thermostat, endpoint:str, method='post', **kwargs):
+    "Request a Netatmo API endpoint with caching, rate limiting, retries and auto-refresh on expired token."
+    return self._drive(self._request_flow(endpoint, method, **kwargs))
+
+# %% ../nbs/00_core.ipynb 21
+@patch
+def _ttl(self:Thermostat, endpoint, data):
+    "Cache TTL in seconds for a call to `endpoint` with `data`, 0 if it shouldn't be cached"
+    if self.cache is None: return 0
+    ttl = self.ttls.get(endpoint, 0)
+    return ttl.get(data.get('scale'), 0) if isinstance(ttl, dict) else ttl
 
+@patch
+def _invalidate(self:Thermostat, endpoint, data):
+    "Drop cached reads made stale by a successful write to `endpoint`"
+    hid = data.get('home_id')
+    for ep in cache_invalidates.get(endpoint, []):
+        self.cache.invalidate(lambda k: k[0] == ep and dict(k[1:]).get('home_id', hid) == hid)
 
-# %% ../nbs/00_core.ipynb 22
+# %% ../nbs/00_core.ipynb 25
 @patch
 def homesdata(self:Thermostat):
     return self._request('homesdata')
 
-# %% ../nbs/00_core.ipynb 27
+# %% ../nbs/00_core.ipynb 30
 @patch
 def homestatus(self:Thermostat, home_id): return self._request('homestatus', data={'home_id': home_id})
 
-# %% ../nbs/00_core.ipynb 32
+# %% ../nbs/00_core.ipynb 35
 @patch
 def getroommeasure(self:Thermostat,
     home_id:str,   # Home ID
@@ -85,7 +216,7 @@ def getroommeasure(self:Thermostat,
     if end: d['date_end'] = end
     return self._request('getroommeasure', data=d)
 
-# %% ../nbs/00_core.ipynb 39
+# %% ../nbs/00_core.ipynb 42
 @patch
 def setroomthermpoint(self:Thermostat,
     home_id:str,   # Home ID
@@ -100,13 +231,15 @@ def setroomthermpoint(self:Thermostat,
     if endtime: d['endtime'] = endtime
     return self._request('setroomthermpoint', data=d)
 
+def _heated_rooms(status): return [r for r in status.home.rooms if 'therm_setpoint_temperature' in r]
+def _room_temps(st): return [dict(room_id=r.id, temperature=r.therm_measured_temperature, setpoint=r.therm_setpoint_temperature, setpoint_mode=r.therm_setpoint_mode) for r in _heated_rooms(st)]
+
 @patch
 def room_temperatures(self:Thermostat, home_id: str):
     "Nicer way to get a list of the temperatures of all room in the home"
-    st = self.homestatus(home_id)
-    return [dict(room_id=r.id, temperature=r.therm_measured_temperature, setpoint=r.therm_setpoint_temperature, setpoint_mode=r.therm_setpoint_mode) for r in st.home.rooms]
+    return _room_temps(self.homestatus(home_id))
 
-# %% ../nbs/00_core.ipynb 48
+# %% ../nbs/00_core.ipynb 51
 @patch
 def setthermmode(self:Thermostat,
     home_id:str,   # Home ID
@@ -118,7 +251,7 @@ def setthermmode(self:Thermostat,
     if endtime: d['endtime'] = endtime
     return self._request('setthermmode', data=d)
 
-# %% ../nbs/00_core.ipynb 57
+# %% ../nbs/00_core.ipynb 60
 @patch
 def getmeasure(self:Thermostat,
     device_id:str,     # Device MAC address
@@ -135,7 +268,7 @@ def getmeasure(self:Thermostat,
     if end: d['date_end'] = end
     return self._request('getmeasure', data=d)
 
-# %% ../nbs/00_core.ipynb 64
+# %% ../nbs/00_core.ipynb 67
 @patch
 def createnewhomeschedule(self:Thermostat,
     home_id:str,       # Home ID
@@ -146,11 +279,11 @@ def createnewhomeschedule(self:Thermostat,
     away_temp:float=17, # Away mode temp
 ):
     "Create a new weekly schedule"
-    return self._request('createnewhomeschedule', data={
+    return self._request('createnewhomeschedule', json={
         'home_id': home_id, 'name': name, 'zones': zones, 
         'timetable': timetable, 'hg_temp': hg_temp, 'away_temp': away_temp})
 
-# %% ../nbs/00_core.ipynb 66
+# %% ../nbs/00_core.ipynb 69
 @patch
 def switchhomeschedule(self:Thermostat,
     home_id:str,       # Home ID
@@ -159,7 +292,7 @@ def switchhomeschedule(self:Thermostat,
     "Switch to a specific weekly schedule"
     return self._request('switchhomeschedule', data={'home_id': home_id, 'schedule_id': schedule_id})
 
-# %% ../nbs/00_core.ipynb 68
+# %% ../nbs/00_core.ipynb 71
 @patch
 def synchomeschedule(self:Thermostat,
     home_id:str,       # Home ID
@@ -175,87 +308,31 @@ def synchomeschedule(self:Thermostat,
     if name: d['name'] = name
     if hg_temp: d['hg_temp'] = hg_temp
     if away_temp: d['away_temp'] = away_temp
-    return self._request('synchomeschedule', data=d)
-
-# %% ../nbs/00_core.ipynb 84
-def ControlBtn(text, change, current_temp, **kwargs):
-    return Button(text, 
-        hx_post="/setpoint", 
-        hx_vals=json.dumps({'change': change, 'current_setpoint': current_temp}),
-        hx_target="#setpoint-display",
-        hx_swap="outerHTML",
-        cls="w-10 h-10 rounded-full border border-black/5 bg-white/50 text-slate-700 text-lg flex items-center justify-center hover:bg-white hover:scale-105 transition-all shadow-sm cursor-pointer",
-        **kwargs
-    )
-
-def SetpointDisplay(temp):
-    return Span(
-        "Target ", Span(f"{temp}°", cls="text-temp-set font-semibold"),
-        id="setpoint-display",
-        cls="text-slate-500 font-medium text-base"
-    )
-
-# %% ../nbs/00_core.ipynb 87
-def to_chart(raw):
-    d = list(raw)[0]
-    return [[d['beg_time']*1000 + i*d['step_time']*1000, v[0]] for i,v in enumerate(d['value'])]
-
-# %% ../nbs/00_core.ipynb 90
-def TempChart(temps_raw, sp_raw):
-    return ApexChart(opts={
-        'chart': {'type': 'area', 'height': 150, 'sparkline': {'enabled': True}},
-        'series': [
-            {'name': 'Temp', 'data': to_chart(temps_raw)},
-            {'name': 'Setpoint', 'data': to_chart(sp_raw)}
-        ],
-        'xaxis': {'type': 'datetime'},
-        'stroke': {'curve': ['smooth', 'stepline'], 'width': [3, 2], 'dashArray': [0, 5]},
-        'colors': ['#00b894', '#e17055'],
-        'fill': {'type': 'gradient', 'gradient': {'opacityFrom': 0.15, 'opacityTo': 0}}
-    })
-
-# %% ../nbs/00_core.ipynb 92
-def ThermostatWidget(t, home_id, room_id, xtra_classes='w-[320px]'):
-    temps_raw = t.getroommeasure(home_id, room_id, type='temperature')
-    sp_raw = t.getroommeasure(home_id, room_id, type='sp_temperature')
-    status = t.homestatus(home_id)
-    room = [r for r in status.home.rooms if r.id == room_id][0]
-    sp = room.therm_setpoint_temperature
-    
-    return Div(
-        Div(
-            Span("CLIMATE", cls="font-display text-xs font-bold text-slate-400 uppercase tracking-widest"),
-            Div(
-                ControlBtn("−", -0.5, sp, id="btn-minus"),
-                ControlBtn("+", 0.5, sp, id="btn-plus"), cls="flex gap-2"),
-            cls="flex justify-between items-center mb-6"
-        ),
-        Div(
-            Span(f"{room.therm_measured_temperature}°", cls="font-display text-6xl text-temp-real leading-none"),
-            SetpointDisplay(sp),
-            cls="flex items-baseline gap-3 flex-wrap"
-        ),
-        Div(TempChart(temps_raw, sp_raw), cls="mt-auto -mx-3 h-[150px]"),
-        cls=f"bg-white/85 backdrop-blur-xl border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col h-full transition-transform hover:-translate-y-1 duration-300 aspect-square {xtra_classes}"
-    )
-
-# %% ../nbs/00_core.ipynb 106
-def setup_thermostat_widget(
-    rt,        # FastHTML route decorator from fast_app()
-    t,         # Thermostat instance (authenticated)
-    home_id,   # Netatmo home ID
-    room_id,   # Room ID to control
-    **kwargs,  # Extra args to pass to thermostat widget
-):
-    "Register thermostat routes and return the climate widget. Call once after fast_app()."
-    
-    @rt("/setpoint")
-    def post(change: float, current_setpoint: float):
-        new_temp = round(current_setpoint + change, 1)
-        t.setroomthermpoint(home_id, room_id, 'manual', new_temp, int(time() + 3600))
-        return (SetpointDisplay(new_temp),
-                ControlBtn("−", -0.5, new_temp, id="btn-minus", hx_swap_oob="true"),
-                ControlBtn("+", 0.5, new_temp, id="btn-plus", hx_swap_oob="true"))
+    return self._request('synchomeschedule', json=d)
+
+# %% ../nbs/00_core.ipynb 73
+class AsyncThermostat(Thermostat):
+    def __init__(self, *args, client=None, **kwargs): super().__init__(*args, client=client or make_async_client(), **kwargs)
+
+    def _drive(self, flow):
+        return adrive(flow, self.client.send if self.metrics is None else ainstrumented(self.client.send, self.metrics, 'netatmo'))
+    async def close(self): await self.client.aclose()
+    async def __aenter__(self): return self
+    async def __aexit__(self, *args): await self.close()
+
+@patch
+async def room_temperatures(self:AsyncThermostat, home_id: str):
+    "Nicer way to get a list of the temperatures of all room in the home"
+    return _room_temps(await self.homestatus(home_id))
 
-    return ThermostatWidget(t, home_id, room_id, **kwargs)
+# %% ../nbs/00_core.ipynb 102
+_all_ = ['ControlBtn', 'SetpointDisplay', 'MeasuredTemp', 'to_chart', 'TempChart', 'room_history', 'ThermostatCard',
+         'thermostat_fragments', 'ThermostatWidget', 'ThermostatGrid', 'AsyncThermostatWidget', 'AsyncThermostatGrid',
+         'setpoint_writes', 'setup_setpoint_route', 'setup_thermostat_widget', 'setup_thermostat_grid']
+_widgets = _all_ # Resolved lazily by `__getattr__`, still exported by `import *`
 
+def __getattr__(name):
+    "Load the widget names from `widgets` on first use"
+    if name not in _widgets: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from netatmo_thermostat import widgets
+    return getattr(widgets, name)
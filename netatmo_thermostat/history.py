@@ -0,0 +1,173 @@
+"""A local, incremental store for room and boiler history"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/04_history.ipynb.
+
+# %% auto 0
+__all__ = ['max_points', 'windows', 'backfill', 'abackfill', 'HistoryStore']
+
+# %% ../nbs/04_history.ipynb 2
+import sqlite3, threading, asyncio
+import numpy as np
+from time import time
+from itertools import islice
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from fastcore.utils import patch
+
+from .core import scale_secs
+from .series import measure_arrays
+
+# %% ../nbs/04_history.ipynb 5
+max_points = 1024  # Netatmo's limit on points returned by one measure call
+
+def windows(beg, end, scale, limit=max_points):
+    "Split `[beg, end)` into consecutive windows holding at most `limit` points at `scale`"
+    span = scale_secs[scale]*limit
+    return [(b, min(b+span, end)) for b in range(beg, end, span)]
+
+def _dedup(ts, vs, end, last):
+    "Keep the sorted, unique points before `end` and after `last`"
+    ts,i = np.unique(ts, return_index=True)
+    keep = (ts < end) & (ts > last)
+    return ts[keep], vs[i][keep]
+
+# %% ../nbs/04_history.ipynb 7
+def backfill(
+    fetch,              # Called as `fetch(begin, end)`, returns a measure response
+    beg:int,            # Start timestamp
+    end:int,            # End timestamp
+    scale:str='1hour',  # Time scale: 30min, 1hour, 3hours, 1day, 1week, 1month
+    limit:int=max_points, # Max points per call
+    workers:int=4,      # Max windows fetched concurrently
+):
+    "Fetch `[beg, end)` in point-limited windows concurrently, yielding `(timestamps, values)` chunks in time order"
+    ws,last = iter(windows(beg, end, scale, limit)),-1
+    with ThreadPoolExecutor(workers) as ex:
+        futs = deque(ex.submit(fetch, *w) for w in islice(ws, workers))
+        while futs:
+            raw = futs.popleft().result()
+            if (w := next(ws, None)): futs.append(ex.submit(fetch, *w))
+            ts,vs = _dedup(*measure_arrays(raw), end, last)
+            if len(ts): last = ts[-1]; yield ts, vs
+
+# %% ../nbs/04_history.ipynb 9
+async def abackfill(fetch, beg:int, end:int, scale:str='1hour', limit:int=max_points, workers:int=4):
+    "Async version of `backfill`, an async generator of `(timestamps, values)` chunks in time order"
+    ws,last = iter(windows(beg, end, scale, limit)),-1
+    futs = deque(asyncio.ensure_future(fetch(*w)) for w in islice(ws, workers))
+    try:
+        while futs:
+            raw = await futs.popleft()
+            if (w := next(ws, None)): futs.append(asyncio.ensure_future(fetch(*w)))
+            ts,vs = _dedup(*measure_arrays(raw), end, last)
+            if len(ts): last = ts[-1]; yield ts, vs
+    finally:
+        for f in futs: f.cancel()
+
+# %% ../nbs/04_history.ipynb 13
+_schema = '''
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS series (id INTEGER PRIMARY KEY, home TEXT, target TEXT, type TEXT, scale TEXT, UNIQUE(home, target, type, scale));
+CREATE TABLE IF NOT EXISTS points (series INTEGER, ts INTEGER, value REAL, PRIMARY KEY(series, ts)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS spans (series INTEGER, beg INTEGER, end INTEGER, PRIMARY KEY(series, beg)) WITHOUT ROWID;
+'''
+
+def _gaps(spans, beg, end):
+    "Sub-ranges of `[beg, end)` not covered by the sorted, disjoint `spans`"
+    gaps,cur = [],beg
+    for b,e in spans:
+        if e <= cur: continue
+        if b >= end: break
+        if b > cur: gaps.append((cur, b))
+        cur = e
+    if cur < end: gaps.append((cur, end))
+    return gaps
+
+def _merge(spans):
+    "Sort `spans` and merge the ones that overlap or touch"
+    res = []
+    for b,e in sorted(spans):
+        if res and b <= res[-1][1]: res[-1] = (res[-1][0], max(res[-1][1], e))
+        else: res.append((b, e))
+    return res
+
+# %% ../nbs/04_history.ipynb 15
+class HistoryStore:
+    "SQLite-backed store of Netatmo measure history that only fetches the ranges it doesn't have yet"
+    def __init__(self,
+        t,                              # `Thermostat` used to fetch missing ranges
+        path:str='netatmo_history.db',  # SQLite file (`':memory:'` for a throwaway store)
+        now=time,                       # Clock returning the current unix time
+    ):
+        self.t,self.now,self.lock = t,now,threading.RLock()
+        self.con = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.con.executescript(_schema)
+
+    def close(self): self.con.close()
+
+    def series(self, home, target, type, scale):
+        "Id of the series `(home, target, type, scale)`, created if new"
+        with self.lock:
+            self.con.execute('INSERT OR IGNORE INTO series (home, target, type, scale) VALUES (?,?,?,?)', (home, target, type, scale))
+            return self.con.execute('SELECT id FROM series WHERE home=? AND target=? AND type=? AND scale=?', (home, target, type, scale)).fetchone()[0]
+
+    def spans(self, sid):
+        "Sorted time spans already stored for series `sid`"
+        with self.lock: return self.con.execute('SELECT beg, end FROM spans WHERE series=? ORDER BY beg', (sid,)).fetchall()
+
+    def put(self, sid, ts, vs, beg=None, end=None):
+        "Store points `ts`/`vs` for series `sid`, marking `[beg, end)` as covered"
+        with self.lock:
+            self.con.execute('BEGIN')
+            self.con.executemany('INSERT OR REPLACE INTO points VALUES (?,?,?)', zip([sid]*len(ts), np.asarray(ts).tolist(), np.asarray(vs).tolist()))
+            if beg is not None and end > beg:
+                spans = _merge(self.spans(sid) + [(beg, end)])
+                self.con.execute('DELETE FROM spans WHERE series=?', (sid,))
+                self.con.executemany('INSERT INTO spans VALUES (?,?,?)', [(sid, b, e) for b,e in spans])
+            self.con.execute('COMMIT')
+
+    def get(self, sid, beg, end):
+        "Timestamps and values of series `sid` in `[beg, end)` as NumPy arrays"
+        with self.lock: rows = self.con.execute('SELECT ts, value FROM points WHERE series=? AND ts>=? AND ts<? ORDER BY ts', (sid, beg, end)).fetchall()
+        a = np.array(rows, dtype=float).reshape(-1, 2)
+        return a[:, 0].astype(np.int64), a[:, 1]
+
+# %% ../nbs/04_history.ipynb 17
+@patch
+def fill(self:HistoryStore, sid, fetch, scale, beg, end, workers=4):
+    "Fetch the parts of `[beg, end)` missing from series `sid` with `fetch(begin, end)` and store them"
+    for b,e in _gaps(self.spans(sid), beg, end):
+        for ts,vs in backfill(fetch, b, e, scale, workers=workers): self.put(sid, ts, vs)
+        self.put(sid, [], [], b, min(e, int(self.now()) - scale_secs[scale]))
+
+@patch
+def roommeasure(self:HistoryStore,
+    home_id:str,             # Home ID
+    room_id:str,             # Room ID
+    type:str='temperature',  # Data type: temperature or sp_temperature
+    scale:str='1hour',       # Time scale: 30min, 1hour, 3hours, 1day, 1week, 1month
+    begin:int=None,          # Start timestamp, defaults to a week before `end`
+    end:int=None,            # End timestamp, defaults to now
+):
+    "Room history as NumPy arrays `(timestamps, values)`, fetching only what isn't stored yet"
+    end = int(self.now() if end is None else end)
+    begin = end - 7*86400 if begin is None else int(begin)
+    sid = self.series(home_id, room_id, type, scale)
+    self.fill(sid, lambda b,e: self.t.getroommeasure(home_id, room_id, scale, type, b, e), scale, begin, end)
+    return self.get(sid, begin, end)
+
+@patch
+def measure(self:HistoryStore,
+    device_id:str,         # Device MAC address
+    module_id:str=None,    # Module MAC (if reading from a module)
+    type:str='boileron',   # Data type: boileron, boileroff, sum_boiler_on, sum_boiler_off
+    scale:str='1hour',     # Time scale: 30min, 1hour, 3hours, 1day, 1week, 1month
+    begin:int=None,        # Start timestamp, defaults to a week before `end`
+    end:int=None,          # End timestamp, defaults to now
+):
+    "Boiler history as NumPy arrays `(timestamps, values)`, fetching only what isn't stored yet"
+    end = int(self.now() if end is None else end)
+    begin = end - 7*86400 if begin is None else int(begin)
+    sid = self.series(device_id, module_id or device_id, type, scale)
+    self.fill(sid, lambda b,e: self.t.getmeasure(device_id, module_id, scale, type, b, e), scale, begin, end)
+    return self.get(sid, begin, end)
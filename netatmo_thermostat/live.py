@@ -0,0 +1,112 @@
+"""Background polling with server-sent updates for the dashboard widgets"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/09_live.ipynb.
+
+# %% auto 0
+__all__ = ['sse_hdr', 'Hub', 'Poller', 'LiveSink', 'setup_live']
+
+# %% ../nbs/09_live.ipynb 2
+import asyncio, inspect
+from contextlib import asynccontextmanager
+from fastcore.utils import tuplify
+from fasthtml.common import *
+
+from .render import data_key
+
+# %% ../nbs/09_live.ipynb 6
+class Hub:
+    "Fan-out of messages to subscribers, each with its own bounded queue"
+    def __init__(self, maxsize=16): self.maxsize,self.subs = maxsize,set()
+    def __len__(self): return len(self.subs)
+
+    def publish(self, msg):
+        "Queue `msg` for every subscriber, dropping a slow subscriber's oldest message if its queue is full"
+        for q in list(self.subs):
+            if q.full(): q.get_nowait()
+            q.put_nowait(msg)
+
+    @asynccontextmanager
+    async def subscribe(self):
+        "Queue receiving published messages while the context is open"
+        q = asyncio.Queue(self.maxsize)
+        self.subs.add(q)
+        try: yield q
+        finally: self.subs.discard(q)
+
+# %% ../nbs/09_live.ipynb 9
+class Poller:
+    "Polls sources in the background and publishes the fragments that changed to a `Hub`"
+    def __init__(self, hub=None,
+                 leader=None): # `Leader` electing the one worker that fetches, the others polling its snapshots in `leader.state`
+        self.hub,self.leader = hub or Hub(),leader
+        self.sources,self.latest,self.keys,self.errors,self.frags,self.tasks = {},{},{},{},{},[]
+
+    def add(self,
+            name, # Key of the source in `latest`
+            fetch, # Callable returning the data or an awaitable of it
+            render, # Callable turning the data into fragments, each with an `id`
+            every=60.): # Seconds between polls
+        "Register a source to poll"
+        self.sources[name] = (fetch, render, every)
+
+    async def poll(self, name):
+        "Fetch `name` once, publishing and returning the fragments that changed (rendering only if the data did)"
+        render,res = self.sources[name][1],await self._fetch(name)
+        self.latest[name],key = res,data_key(res)
+        if self.keys.get(name) == key: return []
+        self.keys[name] = key
+        changed = []
+        for ft in tuplify(render(res)):
+            ft = ft(hx_swap_oob='true')
+            if to_xml(self.frags.get(ft.id, '')) != to_xml(ft): self.frags[ft.id] = ft; changed.append(ft)
+        if changed: self.hub.publish(sse_message(tuple(changed)))
+        return changed
+
+    async def _fetch(self, name):
+        if self.leader is not None and not self.leader():
+            if (res := self.leader.state.get(f'poll:{name}')) is None: raise LookupError(f'No {name} snapshot from the leader yet')
+            return res
+        res = self.sources[name][0]()
+        if inspect.isawaitable(res): res = await res
+        if self.leader is not None: self.leader.state.set(f'poll:{name}', res)
+        return res
+
+    async def _run(self, name):
+        while True:
+            try: await self.poll(name); self.errors.pop(name, None)
+            except Exception as e: self.errors[name] = e
+            await asyncio.sleep(self.sources[name][2])
+
+    def snapshot(self):
+        "SSE message with every current fragment, for clients that just connected"
+        return sse_message(tuple(self.frags.values()))
+
+    async def start(self): self.tasks = [asyncio.create_task(self._run(n)) for n in self.sources]
+
+    async def stop(self):
+        for t in self.tasks: t.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+
+# %% ../nbs/09_live.ipynb 17
+sse_hdr = Script(src="https://cdn.jsdelivr.net/npm/htmx-ext-sse@2.2.2/sse.js")
+
+def LiveSink(path='/live'): return Div(hx_ext='sse', sse_connect=path, sse_swap='message', hx_swap='none', style='display:none')
+
+def setup_live(
+    rt, # FastHTML route decorator from fast_app()
+    poller, # `Poller` whose updates to stream
+    path='/live', # Route of the event stream
+    ping=15., # Seconds of silence before sending a keep-alive comment
+):
+    "Register the live updates SSE route and return the `LiveSink` to include in the page"
+    async def stream():
+        async with poller.hub.subscribe() as q:
+            if poller.frags: yield poller.snapshot()
+            while True:
+                try: yield await asyncio.wait_for(q.get(), ping)
+                except asyncio.TimeoutError: yield ': ping\n\n'
+
+    @rt(path)
+    async def get(): return EventStream(stream())
+    return LiveSink(path)
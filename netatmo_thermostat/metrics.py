@@ -0,0 +1,141 @@
+"""Counters and latency histograms for the API clients and dashboard routes, in Prometheus' text format"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/15_metrics.ipynb.
+
+# %% auto 0
+__all__ = ['latency_buckets', 'content_type', 'Metrics', 'instrumented', 'ainstrumented', 'MetricsMiddleware',
+           'setup_metrics_route']
+
+# %% ../nbs/15_metrics.ipynb 2
+import hmac, threading, httpx
+from time import perf_counter
+from bisect import bisect_left
+from itertools import accumulate, groupby
+from collections import Counter
+from contextlib import contextmanager
+from fastcore.basics import patch
+
+# %% ../nbs/15_metrics.ipynb 5
+latency_buckets = (.005, .01, .025, .05, .1, .25, .5, 1., 2.5, 5., 10.)
+content_type = 'text/plain; version=0.0.4; charset=utf-8'
+
+def _key(name, labels): return name, tuple(sorted((k, str(v)) for k,v in labels.items()))
+
+class Metrics:
+    "Thread-safe counters and histograms, rendered for Prometheus by `render`"
+    def __init__(self, buckets=latency_buckets):
+        self.buckets,self.lock = buckets,threading.Lock()
+        self.counts,self.hists,self.caches = Counter(),{},{}
+
+    def inc(self, name, n=1, **labels):
+        "Add `n` to the counter `name` with `labels`"
+        k = _key(name, labels)
+        with self.lock: self.counts[k] += n
+
+    def observe(self, name, secs, **labels):
+        "Record `secs` in the histogram `name` with `labels`"
+        k = _key(name, labels)
+        with self.lock:
+            h = self.hists.get(k) or self.hists.setdefault(k, [0]*(len(self.buckets)+1) + [0.])
+            h[bisect_left(self.buckets, secs)] += 1
+            h[-1] += secs
+
+    @contextmanager
+    def time(self, name, **labels):
+        "Record how long the `with` block takes in the histogram `name`"
+        t0 = perf_counter()
+        try: yield
+        finally: self.observe(name, perf_counter()-t0, **labels)
+
+    def watch(self, cache, name):
+        "Report the hits and misses of `TTLCache` `cache` per key group as `cache_hits_total`/`cache_misses_total` with `cache=name`"
+        self.caches[name] = cache
+
+# %% ../nbs/15_metrics.ipynb 7
+def _esc(v): return v.replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+def _labels(ls): return '{' + ','.join(f'{k}="{_esc(v)}"' for k,v in ls) + '}' if ls else ''
+
+@patch
+def render(self:Metrics):
+    "Every metric in Prometheus' text exposition format"
+    with self.lock: counts,hists = dict(self.counts),{k: list(h) for k,h in self.hists.items()}
+    for c,cache in self.caches.items():
+        for g,s in cache.stats['groups'].items():
+            for kind in ('hits', 'misses'): counts[_key(f'cache_{kind}_total', dict(cache=c, group=g))] = s[kind]
+    out = []
+    for name,items in groupby(sorted(counts.items()), lambda o: o[0][0]):
+        out.append(f'# TYPE {name} counter')
+        out += [f'{name}{_labels(ls)} {v}' for (_,ls),v in items]
+    les = [*map(str, self.buckets), '+Inf']
+    for name,items in groupby(sorted(hists.items()), lambda o: o[0][0]):
+        out.append(f'# TYPE {name} histogram')
+        for (_,ls),h in items:
+            out += [f'{name}_bucket{_labels(ls + (("le", le),))} {c}' for le,c in zip(les, accumulate(h[:-1]))]
+            out += [f'{name}_sum{_labels(ls)} {h[-1]}', f'{name}_count{_labels(ls)} {sum(h[:-1])}']
+    return '\n'.join(out) + '\n'
+
+# %% ../nbs/15_metrics.ipynb 11
+def _ep(req): return req.url.path.rsplit('/', 1)[-1]
+
+def _record(metrics, api, req, t0, r=None, err=None):
+    metrics.observe('upstream_request_seconds', perf_counter()-t0, api=api, endpoint=_ep(req))
+    if err is None: metrics.inc('upstream_responses_total', api=api, endpoint=_ep(req), status=r.status_code)
+    else: metrics.inc('upstream_errors_total', api=api, endpoint=_ep(req), error=type(err).__name__)
+
+def instrumented(send, metrics, api):
+    "`send` recording each request's latency and outcome in `metrics` under `api`"
+    def _send(req):
+        t0 = perf_counter()
+        try: r = send(req)
+        except httpx.TransportError as e: _record(metrics, api, req, t0, err=e); raise
+        _record(metrics, api, req, t0, r)
+        return r
+    return _send
+
+def ainstrumented(send, metrics, api):
+    "Async version of `instrumented`"
+    async def _send(req):
+        t0 = perf_counter()
+        try: r = await send(req)
+        except httpx.TransportError as e: _record(metrics, api, req, t0, err=e); raise
+        _record(metrics, api, req, t0, r)
+        return r
+    return _send
+
+# %% ../nbs/15_metrics.ipynb 14
+class MetricsMiddleware:
+    "ASGI middleware recording `http_request_seconds` per route in `metrics` and serving them at `path`"
+    def __init__(self, app, metrics, path='/metrics', token=None):
+        self.app,self.metrics,self.path = app,metrics,path
+        self.auth = f'Bearer {token}'.encode() if token else None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http': return await self.app(scope, receive, send)
+        if scope['path'] == self.path: return await self._serve(scope, send)
+        t0,started = perf_counter(),False
+        def record(status): self.metrics.observe('http_request_seconds', perf_counter()-t0, route=getattr(scope.get('route'), 'path', 'other'), method=scope['method'], status=status)
+        async def _send(msg):
+            nonlocal started
+            if msg['type'] == 'http.response.start': started = True; record(msg['status'])
+            await send(msg)
+        try: await self.app(scope, receive, _send)
+        except Exception:
+            if not started: record(500)
+            raise
+
+    async def _serve(self, scope, send):
+        ok = self.auth is None or hmac.compare_digest(dict(scope['headers']).get(b'authorization', b''), self.auth)
+        body = self.metrics.render().encode() if ok else b''
+        await send({'type': 'http.response.start', 'status': 200 if ok else 401,
+                    'headers': [(b'content-type', content_type.encode()), (b'content-length', str(len(body)).encode())]})
+        await send({'type': 'http.response.body', 'body': body})
+
+def setup_metrics_route(
+    rt, # FastHTML route decorator from fast_app()
+    metrics, # `Metrics` to serve
+    path='/metrics', # Route serving them
+):
+    "Serve `metrics` from an ordinary route, behind the app's beforeware (such as its login) like any other page"
+    from starlette.responses import Response
+    @rt(path)
+    def get(): return Response(metrics.render(), media_type=content_type)
@@ -0,0 +1,101 @@
+"""Typed, lazily decoded views over API responses"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/11_models.ipynb.
+
+# %% auto 0
+__all__ = ['response_models', 'Model', 'Module', 'Room', 'Schedule', 'Home', 'HomesData', 'HomeStatus', 'RealtimeResult',
+           'Realtime', 'decode']
+
+# %% ../nbs/11_models.ipynb 2
+from .series import Measure
+
+# %% ../nbs/11_models.ipynb 5
+def _wrap(v, cls):
+    if isinstance(v, dict): return cls(v)
+    if isinstance(v, list) and v and isinstance(v[0], (dict, list)): return [_wrap(o, cls) for o in v]
+    return v
+
+class Model:
+    "Lazily decoded view over a JSON object, wrapping nested objects on first access"
+    __slots__ = ('_d', '_c')
+    _nested = {} # Model class of nested objects (or lists of them) by field
+
+    def __init__(self, d): self._d,self._c = d,{}
+
+    def __getattr__(self, k):
+        if k in Model.__slots__: raise AttributeError(k)
+        if k in self._c: return self._c[k]
+        try: v = self._d[k]
+        except KeyError: raise AttributeError(k) from None
+        if isinstance(v, (dict, list)): v = self._c[k] = _wrap(v, self._nested.get(k, Model))
+        return v
+
+    def __getitem__(self, k):
+        if k not in self._d: raise KeyError(k)
+        return getattr(self, k)
+
+    def get(self, k, default=None): return self[k] if k in self._d else default
+    def __contains__(self, k): return k in self._d
+    def __iter__(self): return iter(self._d)
+    def __len__(self): return len(self._d)
+    def __eq__(self, o): return self._d == (o._d if isinstance(o, Model) else o)
+    def __repr__(self): return f'{type(self).__name__}({self._d!r})'
+    def to_dict(self): return self._d
+
+# %% ../nbs/11_models.ipynb 7
+class Module(Model):
+    "A device: relay, thermostat, valve... (topology from `homesdata`, state from `homestatus`)"
+    __slots__ = ()
+    id:str; type:str; name:str; room_id:str; bridge:str; reachable:bool
+    battery_state:str; battery_level:int; rf_strength:int; wifi_strength:int; firmware_revision:int; boiler_status:bool
+
+class Room(Model):
+    "A room (topology from `homesdata`, temperatures from `homestatus`)"
+    __slots__ = ()
+    id:str; name:str; type:str; module_ids:list; reachable:bool; anticipating:bool; open_window:bool
+    therm_measured_temperature:float; therm_setpoint_temperature:float; therm_setpoint_mode:str
+    therm_setpoint_start_time:int; therm_setpoint_end_time:int; heating_power_request:int
+
+class Schedule(Model):
+    "A weekly heating schedule: `zones` with their temperatures and a `timetable` of zone changes"
+    __slots__ = ()
+    id:str; name:str; type:str; default:bool; selected:bool; timetable:list; zones:list; hg_temp:float; away_temp:float
+
+class Home(Model):
+    "A home with its rooms, modules and schedules"
+    __slots__ = ()
+    _nested = {'rooms': Room, 'modules': Module, 'schedules': Schedule}
+    id:str; name:str; timezone:str; therm_mode:str; therm_setpoint_default_duration:int; rooms:list; modules:list; schedules:list
+
+class HomesData(Model):
+    "`homesdata` response body"
+    __slots__ = ()
+    _nested = {'homes': Home}
+    homes:list; user:dict
+
+class HomeStatus(Model):
+    "`homestatus` response body"
+    __slots__ = ()
+    _nested = {'home': Home}
+    home:Home
+
+# %% ../nbs/11_models.ipynb 9
+class RealtimeResult(Model):
+    "Inverter readings of a `getRealtimeInfo` response (powers in W, energies in kWh)"
+    __slots__ = ()
+    inverterSN:str; sn:str; acpower:float; yieldtoday:float; yieldtotal:float; feedinpower:float; feedinenergy:float
+    consumeenergy:float; soc:float; batPower:float; powerdc1:float; powerdc2:float; inverterType:str; inverterStatus:str; uploadTime:str
+
+class Realtime(Model):
+    "`getRealtimeInfo` response"
+    __slots__ = ()
+    _nested = {'result': RealtimeResult}
+    success:bool; exception:str; code:int; result:RealtimeResult
+
+# %% ../nbs/11_models.ipynb 11
+response_models = {'homesdata': HomesData, 'homestatus': HomeStatus, 'getroommeasure': Measure, 'getmeasure': Measure}
+
+def decode(endpoint, body):
+    "Typed, lazily decoded model of `endpoint`'s response `body`"
+    cls = response_models.get(endpoint)
+    return cls(body) if cls is not None else _wrap(body, Model)
@@ -0,0 +1,93 @@
+"""Token-bucket request scheduling that keeps the API clients inside their quotas"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/06_ratelimit.ipynb.
+
+# %% auto 0
+__all__ = ['TokenBucket', 'RateLimiter', 'retry_after']
+
+# %% ../nbs/06_ratelimit.ipynb 2
+import threading
+from time import monotonic
+from itertools import count
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+
+# %% ../nbs/06_ratelimit.ipynb 5
+class TokenBucket:
+    "Allows `limit` requests per `per` seconds, refilling continuously"
+    def __init__(self, limit, per):
+        self.limit,self.per = limit,per
+        self.tokens,self.t = float(limit),None
+
+    def _fill(self, now):
+        if self.t is not None: self.tokens = min(self.limit, self.tokens + (now-self.t)*self.limit/self.per)
+        self.t = now
+
+    def wait(self, now):
+        "Seconds until a request may be made"
+        self._fill(now)
+        return max(0., (1-self.tokens)*self.per/self.limit)
+
+    def take(self, now): self._fill(now); self.tokens -= 1
+
+# %% ../nbs/06_ratelimit.ipynb 8
+class RateLimiter:
+    "Token-bucket scheduler with shared and per-key budgets, priorities and server-requested pauses"
+    poll = 0.01 # seconds a ready request waits for a higher-priority one to go first
+
+    def __init__(self,
+                 budgets=(), # `(limit, per)` pairs every request counts against
+                 key_budgets=None, # Extra `(limit, per)` pairs per key
+                 clock=monotonic):
+        self.clock,self.lock = clock,threading.Lock()
+        self.shared = [TokenBucket(*b) for b in budgets]
+        self.key_budgets,self.keyed = key_budgets or {},{}
+        self.waiting,self.seq = {},count()
+        self.paused_until = 0.
+
+    def _buckets(self, key):
+        if key not in self.keyed: self.keyed[key] = [TokenBucket(*b) for b in self.key_budgets.get(key, [])]
+        return self.keyed[key]
+
+    def _wait(self, key, now): return max([b.wait(now) for b in self._buckets(key)], default=0.)
+
+    def _poll(self, tk):
+        with self.lock:
+            now,(prio,key) = self.clock(),self.waiting[tk]
+            w = max(self._wait(key, now), self.paused_until-now, *(b.wait(now) for b in self.shared))
+            if w > 0: return w
+            if any((p,o) < (prio,tk) and not self._wait(k, now) for o,(p,k) in self.waiting.items()): return self.poll
+            for b in self.shared + self._buckets(key): b.take(now)
+            del self.waiting[tk]
+            return 0
+
+    def acquire(self, key=None, priority=1):
+        "Flow yielding seconds to wait until a `key` request with `priority` (lower goes first) may be made"
+        with self.lock: tk = next(self.seq); self.waiting[tk] = (priority, key)
+        try:
+            while (w := self._poll(tk)) > 0: yield w
+        finally:
+            with self.lock: self.waiting.pop(tk, None)
+
+    def pause(self, secs):
+        "Hold all requests for `secs` seconds"
+        with self.lock: self.paused_until = max(self.paused_until, self.clock()+secs)
+
+    def headroom(self):
+        "Requests left in each budget, remaining pause and number of waiting requests"
+        with self.lock:
+            now = self.clock()
+            for b in self.shared + sum(self.keyed.values(), []): b._fill(now)
+            def rep(bs): return [dict(limit=b.limit, per=b.per, remaining=int(b.tokens)) for b in bs]
+            return dict(shared=rep(self.shared), keys={k: rep(bs) for k,bs in self.keyed.items() if bs},
+                        paused=max(0., self.paused_until-now), waiting=len(self.waiting))
+
+# %% ../nbs/06_ratelimit.ipynb 13
+def retry_after(r, default=60.):
+    "Seconds to wait before retrying according to `r`'s `Retry-After` header, `default` if absent or invalid"
+    v = r.headers.get('retry-after')
+    if v is None: return default
+    try: return max(0., float(v))
+    except ValueError: pass
+    try: return max(0., (parsedate_to_datetime(v) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError): return default
@@ -0,0 +1,60 @@
+"""Fragment caching and conditional GETs for the dashboard routes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/13_render.ipynb.
+
+# %% auto 0
+__all__ = ['data_key', 'FragmentCache', 'conditional']
+
+# %% ../nbs/13_render.ipynb 2
+import json
+from hashlib import blake2b
+from fastcore.utils import tuplify
+from fasthtml.common import *
+
+from .cache import TTLCache
+from .models import Model
+from .series import Measure
+
+# %% ../nbs/13_render.ipynb 6
+def _plain(o):
+    if isinstance(o, Model): return o.to_dict()
+    if isinstance(o, Measure): return [o.ts, o.vals, o.segs]
+    if hasattr(o, 'tobytes'): return [str(o.dtype), o.shape, blake2b(o.tobytes(), digest_size=16).hexdigest()]
+    return repr(o)
+
+def data_key(*xs):
+    "Short hash of `xs`, the same whenever the data is"
+    return blake2b(json.dumps(xs, sort_keys=True, default=_plain).encode(), digest_size=12).hexdigest()
+
+# %% ../nbs/13_render.ipynb 9
+class FragmentCache:
+    "Rendered HTML of components by the key of the data they show"
+    def __init__(self, maxsize=64): self.cache = TTLCache(maxsize)
+    def __len__(self): return len(self.cache)
+
+    def __call__(self, key, render):
+        "HTML of `render()` for `key`, rendering only on the first call with `key`"
+        html = self.cache.get(('html', key))
+        if html is None:
+            html = to_xml(render())
+            self.cache.set(('html', key), html, float('inf'))
+        return NotStr(html)
+
+    @property
+    def stats(self): return self.cache.stats
+
+# %% ../nbs/13_render.ipynb 12
+def _etags(req): return {t.strip().removeprefix('W/') for t in req.headers.get('if-none-match', '').split(',')}
+def _partial(req): return 'hx-request' in req.headers and 'hx-history-restore-request' not in req.headers
+
+def conditional(
+    req, # The request, for its `If-None-Match`
+    key, # `data_key` of what the response shows
+    render, # Callable returning the response's content
+    cache_control='no-cache', # `Cache-Control` of the response
+):
+    "`304 Not Modified` if the client already has `key`'s version, else `render()` with `key` as its `ETag`"
+    etag = f'"{key}-hx"' if _partial(req) else f'"{key}"'
+    hdrs = {'ETag': f'W/{etag}', 'Cache-Control': cache_control, 'Vary': 'HX-Request, HX-History-Restore-Request'}
+    if {etag, '*'} & _etags(req): return Response(status_code=304, headers=hdrs)
+    return *tuplify(render()), *(HttpHeader(k, v) for k,v in hdrs.items())
@@ -0,0 +1,97 @@
+"""Retries, backoff and circuit breakers for the API clients' request flows"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/07_resilience.ipynb.
+
+# %% auto 0
+__all__ = ['APIError', 'TransientError', 'RateLimited', 'AuthError', 'CircuitOpen', 'checked', 'parse_json', 'CircuitBreaker',
+           'Breakers', 'backoff', 'retrying']
+
+# %% ../nbs/07_resilience.ipynb 2
+import random, threading, httpx
+from time import monotonic
+from .transport import json_loads
+
+# %% ../nbs/07_resilience.ipynb 5
+class APIError(Exception):
+    "A failed API call, with the HTTP `status` if there was a response"
+    def __init__(self, msg, status=None): super().__init__(msg); self.status = status
+
+class TransientError(APIError):
+    "A failure worth retrying, optionally after `wait` seconds"
+    def __init__(self, msg, status=None, wait=None): super().__init__(msg, status); self.wait = wait
+
+class RateLimited(TransientError): "The API quota is used up"
+class AuthError(APIError): "Credentials were rejected, even after refreshing the token"
+class CircuitOpen(APIError): "The endpoint's circuit breaker is open, so the call wasn't attempted"
+
+# %% ../nbs/07_resilience.ipynb 7
+def checked(req):
+    "Flow sending `req`, raising `TransientError` on transport errors and 5xx responses"
+    try: r = yield req
+    except httpx.TransportError as e: raise TransientError(f'{req.url.path}: {type(e).__name__}') from e
+    if r.status_code >= 500: raise TransientError(f'{req.url.path}: HTTP {r.status_code}', r.status_code)
+    return r
+
+def parse_json(r):
+    "JSON body of `r`, raising `TransientError` if it's malformed"
+    try: return json_loads(r.content)
+    except ValueError as e: raise TransientError(f'{r.request.url.path}: malformed JSON', r.status_code) from e
+
+# %% ../nbs/07_resilience.ipynb 9
+class CircuitBreaker:
+    "Fails fast for `cooldown` seconds after `threshold` consecutive failures"
+    def __init__(self, threshold=5, cooldown=30., clock=monotonic):
+        self.threshold,self.cooldown,self.clock = threshold,cooldown,clock
+        self.failures,self.opened,self.lock = 0,None,threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened is None: return 'closed'
+        return 'open' if self.clock() < self.opened+self.cooldown else 'half-open'
+
+    def allow(self):
+        "Whether a call may be made now, letting a single trial call through when half-open"
+        with self.lock:
+            st = self.state
+            if st == 'half-open': self.opened = self.clock()
+            return st != 'open'
+
+    def success(self):
+        with self.lock: self.failures,self.opened = 0,None
+
+    def failure(self):
+        with self.lock:
+            self.failures += 1
+            if self.failures >= self.threshold: self.opened = self.clock()
+
+class Breakers(dict):
+    "A `CircuitBreaker` per key, created with `kwargs` on first use"
+    def __init__(self, **kwargs): super().__init__(); self.kwargs = kwargs
+    def __missing__(self, k): self[k] = b = CircuitBreaker(**self.kwargs); return b
+    @property
+    def states(self): return {k: b.state for k,b in self.items()}
+
+# %% ../nbs/07_resilience.ipynb 12
+def backoff(attempt, base=0.5, cap=30., rand=random.random):
+    "Random wait of up to `base*2**attempt` seconds, capped at `cap`"
+    return rand()*min(cap, base*2**attempt)
+
+# %% ../nbs/07_resilience.ipynb 15
+def retrying(
+    attempt, # Callable returning a fresh flow for one attempt
+    retries=3, # Retries after the first attempt
+    breaker=None, # `CircuitBreaker` guarding the call
+    base=0.5, cap=30., # `backoff` parameters
+    max_wait=None, # Give up instead of waiting longer than this for the server's `wait`
+):
+    "Flow running `attempt()`, retrying `TransientError`s with backoff and failing fast while `breaker` is open"
+    for i in range(retries+1):
+        if breaker is not None and not breaker.allow(): raise CircuitOpen('circuit open')
+        try: res = yield from attempt()
+        except TransientError as e:
+            if breaker is not None and not isinstance(e, RateLimited): breaker.failure()
+            if i == retries or (max_wait is not None and (e.wait or 0) > max_wait): raise
+            yield backoff(i, base, cap) if e.wait is None else e.wait
+        else:
+            if breaker is not None: breaker.success()
+            return res
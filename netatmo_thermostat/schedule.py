@@ -0,0 +1,168 @@
+"""Local lookups, validated edits and diff-only syncing of Netatmo weekly schedules"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/18_schedule.ipynb.
+
+# %% auto 0
+__all__ = ['week_mins', 'temp_range', 'minute_of_week', 'WeekSchedule']
+
+# %% ../nbs/18_schedule.ipynb 2
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from time import time
+from zoneinfo import ZoneInfo
+from fastcore.basics import patch
+
+from .core import AsyncThermostat
+
+# %% ../nbs/18_schedule.ipynb 6
+week_mins = 7*24*60 # Minutes in a week, the range of `m_offset`
+temp_range = (7., 30.) # Setpoints a Netatmo thermostat accepts, in °C
+
+def minute_of_week(
+    t=None, # Timestamp or `datetime`, default now
+    tz:str=None): # Timezone name like `Europe/Madrid`, default the server's
+    "Minutes since Monday 00:00 in `tz` at `t`"
+    tz = ZoneInfo(tz) if tz else None
+    t = t.astimezone(tz) if isinstance(t, datetime) else datetime.fromtimestamp(time() if t is None else t, tz)
+    return t.weekday()*1440 + t.hour*60 + t.minute
+
+# %% ../nbs/18_schedule.ipynb 9
+def _zone_temps(z):
+    if 'rooms_temp' in z: return {r['room_id']: float(r['temp']) for r in z['rooms_temp']}
+    return {r['id']: float(r['therm_setpoint_temperature']) for r in z.get('rooms', [])}
+
+def _check_temp(zid, rid, temp):
+    lo,hi = temp_range
+    if not lo <= temp <= hi: raise ValueError(f'zone {zid} sets room {rid} to {temp}°, outside {lo}-{hi}°')
+
+class WeekSchedule:
+    "A weekly schedule's zones and timetable, indexed for lookups of the zone and room setpoints at any time"
+    def __init__(self,
+        zones:list, # Zone dicts with `id`, `name`, `type` and `rooms_temp` (or `rooms`)
+        timetable:list, # Dicts of `zone_id` and `m_offset`
+        id:str=None, # Schedule ID, needed to `sync`
+        name:str=None, # Schedule name
+        tz:str=None, # Home's timezone, default the server's
+        hg_temp:float=7., # Frost guard temp
+        away_temp:float=17.): # Away mode temp
+        self.id,self.name,self.tz,self.hg_temp,self.away_temp = id,name,tz,hg_temp,away_temp
+        self.zones = {z['id']: {k: v for k,v in z.items() if k not in ('rooms', 'rooms_temp')} for z in zones}
+        self.temps = {z['id']: _zone_temps(z) for z in zones}
+        tt = sorted((e['m_offset'], e['zone_id']) for e in timetable)
+        self.offsets,self.zone_ids = [m for m,_ in tt],[z for _,z in tt]
+        self.validate()
+        self.synced = self.state()
+
+    @classmethod
+    def from_schedule(cls, s, tz=None):
+        "From a `Schedule` of `homesdata` (or its dict)"
+        d = s.to_dict() if hasattr(s, 'to_dict') else s
+        return cls(d['zones'], d['timetable'], d.get('id'), d.get('name'), tz, d.get('hg_temp', 7.), d.get('away_temp', 17.))
+
+    @classmethod
+    def from_home(cls, home, schedule_id=None):
+        "The heating schedule `schedule_id` of a `Home` of `homesdata`, default its selected one"
+        pick = (lambda s: s.id == schedule_id) if schedule_id else (lambda s: s.get('selected'))
+        s = next((s for s in home.get('schedules', []) if s.get('type', 'therm') == 'therm' and pick(s)), None)
+        if s is None: raise ValueError(f"home {home.id} has no {'therm schedule ' + schedule_id if schedule_id else 'selected therm schedule'}")
+        return cls.from_schedule(s, home.get('timezone'))
+
+    def __repr__(self): return f'WeekSchedule({self.name!r}, {len(self.zones)} zones, {len(self.offsets)} changes)'
+
+    def _check_zone(self, zid):
+        if zid not in self.zones: raise ValueError(f'unknown zone {zid}')
+
+    def validate(self):
+        "Raise `ValueError` if Netatmo would reject the schedule"
+        if not self.offsets or self.offsets[0] != 0: raise ValueError('the timetable must start at m_offset 0')
+        if self.offsets[-1] >= week_mins: raise ValueError(f'm_offset {self.offsets[-1]} is past the end of the week')
+        if len(set(self.offsets)) < len(self.offsets): raise ValueError('the timetable has two changes at the same m_offset')
+        for zid in self.zone_ids: self._check_zone(zid)
+        for zid,ts in self.temps.items():
+            for rid,temp in ts.items(): _check_temp(zid, rid, temp)
+
+    def state(self):
+        "Everything `synchomeschedule` sets, without the changes to the zone already in effect"
+        tt = {m: z for i,(m,z) in enumerate(zip(self.offsets, self.zone_ids)) if i == 0 or z != self.zone_ids[i-1]}
+        temps = {(zid, rid): t for zid,ts in self.temps.items() for rid,t in ts.items()}
+        return dict(name=self.name, hg_temp=self.hg_temp, away_temp=self.away_temp,
+                    zones={zid: dict(z) for zid,z in self.zones.items()}, temps=temps, timetable=tt)
+
+# %% ../nbs/18_schedule.ipynb 14
+@patch
+def zone_at_offset(self:WeekSchedule, m):
+    "Id of the zone in effect `m` minutes after Monday 00:00"
+    return self.zone_ids[bisect_right(self.offsets, m % week_mins)-1]
+
+@patch
+def zone_at(self:WeekSchedule, t=None):
+    "Id of the zone in effect at `t`, a timestamp or `datetime` (default now)"
+    return self.zone_at_offset(minute_of_week(t, self.tz))
+
+@patch
+def temp_at(self:WeekSchedule, room_id, t=None):
+    "Scheduled setpoint of `room_id` at `t`, `None` if its zone doesn't set one"
+    return self.temps[self.zone_at(t)].get(room_id)
+
+@patch
+def next_change(self:WeekSchedule, t=None):
+    "Minutes from `t` until the timetable next changes zone, and that zone"
+    m = minute_of_week(t, self.tz)
+    i = bisect_right(self.offsets, m) % len(self.offsets)
+    return (self.offsets[i]-m) % week_mins or week_mins, self.zone_ids[i]
+
+# %% ../nbs/18_schedule.ipynb 17
+@patch
+def set_temp(self:WeekSchedule, zone_id, room_id, temp:float):
+    "Set `room_id`'s setpoint in zone `zone_id`"
+    self._check_zone(zone_id)
+    _check_temp(zone_id, room_id, temp)
+    self.temps[zone_id][room_id] = float(temp)
+
+@patch
+def set_zone(self:WeekSchedule, m_offset:int, zone_id):
+    "Switch to zone `zone_id` at `m_offset` minutes into the week, replacing any change already there"
+    self._check_zone(zone_id)
+    if not 0 <= m_offset < week_mins: raise ValueError(f'm_offset {m_offset} is outside the week')
+    i = bisect_left(self.offsets, m_offset)
+    if i < len(self.offsets) and self.offsets[i] == m_offset: self.zone_ids[i] = zone_id
+    else: self.offsets.insert(i, m_offset); self.zone_ids.insert(i, zone_id)
+
+@patch
+def remove_change(self:WeekSchedule, m_offset:int):
+    "Drop the zone change at `m_offset`, so the zone before it carries on"
+    i = bisect_left(self.offsets, m_offset)
+    if i == len(self.offsets) or self.offsets[i] != m_offset: raise ValueError(f'no change at m_offset {m_offset}')
+    if i == 0: raise ValueError('the timetable must start at m_offset 0')
+    del self.offsets[i], self.zone_ids[i]
+
+# %% ../nbs/18_schedule.ipynb 18
+@patch
+def diff(self:WeekSchedule, other=None):
+    "Changes from `other` (default what Netatmo last had) to this schedule: `(old, new)` by field, and by key within `zones`, `temps` and `timetable`"
+    old,new = self.synced if other is None else other.state(),self.state()
+    d = {k: (old[k], new[k]) for k in ('name', 'hg_temp', 'away_temp') if old[k] != new[k]}
+    for k in ('zones', 'temps', 'timetable'):
+        o,n = old[k],new[k]
+        if (ch := {i: (o.get(i), n.get(i)) for i in o.keys() | n.keys() if o.get(i) != n.get(i)}): d[k] = ch
+    return d
+
+@patch
+def to_api(self:WeekSchedule):
+    "The `zones` and `timetable` lists `synchomeschedule` and `createnewhomeschedule` take"
+    zones = [{**z, 'rooms_temp': [{'room_id': r, 'temp': t} for r,t in self.temps[zid].items()]} for zid,z in self.zones.items()]
+    return zones, [{'zone_id': z, 'm_offset': m} for m,z in zip(self.offsets, self.zone_ids)]
+
+@patch
+def sync(self:WeekSchedule, t, home_id):
+    "Replace the schedule on Netatmo with `synchomeschedule` if `diff` isn't empty, returning the changes (an awaitable of them with an `AsyncThermostat`)"
+    changes,state = self.diff(),self.state()
+    res = t.synchomeschedule(home_id, self.id, *self.to_api(), self.name, self.hg_temp, self.away_temp) if changes else None
+    def done():
+        self.synced = state
+        return changes
+    if not isinstance(t, AsyncThermostat): return done()
+    async def _sync():
+        if res is not None: await res
+        return done()
+    return _sync()
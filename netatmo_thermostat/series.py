@@ -0,0 +1,57 @@
+"""Vectorized helpers for measure time series"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/05_series.ipynb.
+
+# %% auto 0
+__all__ = ['Measure', 'measure_arrays', 'lttb']
+
+# %% ../nbs/05_series.ipynb 2
+import numpy as np
+
+# %% ../nbs/05_series.ipynb 5
+def _measure_table(raw):
+    if isinstance(raw, dict):
+        ts = np.array(list(raw), dtype=np.int64)
+        return ts, np.array(list(raw.values()), dtype=float).reshape(len(raw), -1), np.stack([ts, 0*ts, np.arange(len(ts))], 1)
+    segs = [s for s in raw or [] if len(s['value'])]
+    if not segs: return np.zeros(0, dtype=np.int64), np.zeros((0, 1)), np.zeros((0, 3), dtype=np.int64)
+    ts = np.concatenate([s['beg_time'] + s.get('step_time', 0)*np.arange(len(s['value']), dtype=np.int64) for s in segs])
+    vals = np.concatenate([np.array(s['value'], dtype=float).reshape(len(s['value']), -1) for s in segs])
+    starts = np.cumsum([0] + [len(s['value']) for s in segs[:-1]])
+    return ts, vals, np.array([(s['beg_time'], s.get('step_time', 0), a) for s,a in zip(segs, starts)], dtype=np.int64)
+
+class Measure:
+    "A measure response as NumPy arrays: `ts` (int64 seconds) and `vals` (float64, a column per requested type)"
+    __slots__ = ('ts', 'vals', 'segs')
+    def __init__(self, raw=None): self.ts,self.vals,self.segs = _measure_table(raw)
+    def __len__(self): return len(self.segs)
+    def __repr__(self): return f'Measure({len(self.ts)} points x {self.vals.shape[1]} types)'
+
+    def __getitem__(self, i):
+        "Segment `i` in Netatmo's `{beg_time, step_time, value}` shape"
+        i = range(len(self))[i]
+        beg,step,a = self.segs[i].tolist()
+        b = self.segs[i+1, 2] if i+1 < len(self) else len(self.ts)
+        return {'beg_time': beg, 'step_time': step, 'value': self.vals[a:b].tolist()}
+
+def measure_arrays(raw, col:int=0):
+    "Timestamps (int64 seconds) and values (float64) of column `col` of a measure response, across all segments"
+    m = raw if isinstance(raw, Measure) else Measure(raw)
+    return (m.ts, m.vals[:, col]) if len(m.ts) else (m.ts, np.zeros(0))
+
+# %% ../nbs/05_series.ipynb 8
+def lttb(x, y, n:int):
+    "Downsample `(x, y)` to `n` points with Largest-Triangle-Three-Buckets, keeping the first and last"
+    x,y = np.asarray(x),np.asarray(y, dtype=float)
+    if n >= len(x) or n < 3: return x, y
+    edges = np.linspace(1, len(x)-1, n-1).astype(int)
+    idx = np.empty(n, dtype=int)
+    idx[0],idx[-1],a = 0,len(x)-1,0
+    xf = x.astype(float)
+    for i in range(n-2):
+        lo,hi = edges[i],edges[i+1]
+        nhi = edges[i+2] if i+2 < len(edges) else len(x)
+        cx,cy = xf[hi:nhi].mean(),y[hi:nhi].mean()
+        areas = np.abs((xf[a]-cx)*(y[lo:hi]-y[a]) - (xf[a]-xf[lo:hi])*(cy-y[a]))
+        a = idx[i+1] = lo + areas.argmax()
+    return x[idx], y[idx]
@@ -0,0 +1,113 @@
+"""Cached responses, tokens, telemetry snapshots and leader leases shared between worker processes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/17_shared.ipynb.
+
+# %% auto 0
+__all__ = ['SQLiteState', 'SharedCache', 'Leader', 'SharedTokens']
+
+# %% ../nbs/17_shared.ipynb 2
+import os, pickle, socket, secrets, sqlite3, threading
+from ast import literal_eval
+from time import time
+
+from .cache import TTLCache
+
+# %% ../nbs/17_shared.ipynb 6
+_schema = '''
+PRAGMA journal_mode=WAL;
+CREATE TABLE IF NOT EXISTS kv (key TEXT PRIMARY KEY, value BLOB, expires REAL);
+'''
+
+class SQLiteState:
+    "Pickled values with an expiry in a SQLite file every worker opens"
+    purge_every = 256 # Writes between purges of expired rows
+
+    def __init__(self, path='shared_state.db', clock=time):
+        self.clock,self.lock,self.writes = clock,threading.Lock(),0
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.executescript(_schema)
+
+    def _run(self, sql, *args):
+        with self.lock: return self.db.execute(sql, args).fetchall()
+
+    def _write(self, sql, *args):
+        with self.lock:
+            self.writes += 1
+            if self.writes % self.purge_every == 0: self.db.execute('DELETE FROM kv WHERE expires<=?', (self.clock(),))
+            return self.db.execute(sql, args).rowcount
+
+    def get(self, key, default=None):
+        "Value under `key` if present and not expired, else `default`"
+        rows = self._run('SELECT value FROM kv WHERE key=? AND expires>?', key, self.clock())
+        return pickle.loads(rows[0][0]) if rows else default
+
+    def set(self, key, value, ttl=None, nx=False):
+        "Store `value` under `key` for `ttl` seconds (forever if `None`), only if it's missing or expired when `nx`, returning whether it was stored"
+        now = self.clock()
+        sql = 'INSERT INTO kv VALUES (?,?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, expires=excluded.expires'
+        args = (key, pickle.dumps(value), now+ttl if ttl is not None else float('inf'))
+        return (self._write(sql+' WHERE kv.expires<=?', *args, now) if nx else self._write(sql, *args)) > 0
+
+    def delete(self, *keys):
+        "Drop `keys`, returning how many were there"
+        return sum(self._write('DELETE FROM kv WHERE key=?', k) for k in keys)
+
+    def keys(self, prefix=''):
+        "Keys starting with `prefix` that haven't expired"
+        return [k for k, in self._run('SELECT key FROM kv WHERE substr(key, 1, ?)=? AND expires>?', len(prefix), prefix, self.clock())]
+
+    def acquire(self, key, owner, ttl):
+        "Take the lease `key` for `owner` for `ttl` seconds if it's free, or renew it if `owner` holds it, returning whether `owner` holds it"
+        now,v = self.clock(),pickle.dumps(owner)
+        return self._write('''INSERT INTO kv VALUES (?,?,?) ON CONFLICT(key) DO UPDATE SET value=excluded.value, expires=excluded.expires
+                              WHERE kv.expires<=? OR kv.value=excluded.value''', key, v, now+ttl, now) > 0
+
+    def release(self, key, owner):
+        "Give up the lease `key` if `owner` holds it"
+        return self._write('DELETE FROM kv WHERE key=? AND value=?', key, pickle.dumps(owner)) > 0
+
+    def close(self): self.db.close()
+
+# %% ../nbs/17_shared.ipynb 12
+class SharedCache(TTLCache):
+    "`TTLCache` keeping its entries in a shared `state`, so every worker gets the others' responses"
+    def __init__(self, state, prefix='cache:'):
+        super().__init__()
+        self.state,self.prefix = state,prefix
+
+    def __len__(self): return len(self.state.keys(self.prefix))
+
+    def get(self, key, default=None):
+        v = self.state.get(self.prefix+repr(key))
+        (self.misses if v is None else self.hits)[self._grp(key)] += 1
+        return default if v is None else v
+
+    def set(self, key, value, ttl): self.state.set(self.prefix+repr(key), value, ttl)
+
+    def invalidate(self, pred=None):
+        n = len(self.prefix)
+        return self.state.delete(*[k for k in self.state.keys(self.prefix) if pred is None or pred(literal_eval(k[n:]))])
+
+# %% ../nbs/17_shared.ipynb 17
+class Leader:
+    "Lease on `name` in a shared `state`, held by one worker at a time"
+    def __init__(self, state, name='leader', ttl=180., owner=None):
+        self.state,self.key,self.ttl = state,f'lease:{name}',ttl
+        self.owner = owner or f'{socket.gethostname()}:{os.getpid()}:{secrets.token_hex(4)}'
+
+    def __call__(self):
+        "Whether this worker holds the lease, taking or renewing it"
+        return self.state.acquire(self.key, self.owner, self.ttl)
+
+    def release(self): self.state.release(self.key, self.owner)
+
+# %% ../nbs/17_shared.ipynb 20
+class SharedTokens:
+    "`TokenStore` keeping the tokens and the refresh lock in a shared `state`"
+    def __init__(self, state, key='tokens', lock_ttl=60.):
+        self.state,self.key,self.lock = state,key,Leader(state, f'{key}:refresh', lock_ttl)
+
+    def load(self): return self.state.get(self.key)
+    def save(self, tokens): self.state.set(self.key, tokens)
+    def try_lock(self): return self.lock()
+    def unlock(self): self.lock.release()
@@ -1,75 +1,153 @@
 # AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/01_solar.ipynb.
 
 # %% auto 0
-__all__ = ['SolaX', 'SolarWidget']
+__all__ = ['SolaX', 'AsyncSolaX', 'SolarCard', 'SolarWidget', 'AsyncSolarWidget']
 
 # %% ../nbs/01_solar.ipynb 2
 import os
-import json 
+import asyncio
+import threading
 
 from time import time
-from fastcore.utils import patch
-from fastcore.xtras import dict2obj
+from datetime import datetime
+from fastcore.basics import patch
 
-from fasthtml.common import *
-from monsterui.all import *
-
-from httpx import get as xget, post as xpost
+from .transport import make_client, make_async_client, drive, adrive
+from .resilience import APIError, TransientError, RateLimited, CircuitOpen, CircuitBreaker, checked, parse_json, retrying
+from .models import Realtime
+from .metrics import instrumented, ainstrumented
 
 # %% ../nbs/01_solar.ipynb 9
 class SolaX:
     base = 'https://global.solaxcloud.com/proxyApp/proxy/api'
+    upload_grace = 30 # Seconds an upload takes to show up in the API
     
-    def __init__(self, token_id=None, sn=None):
+    def __init__(self, token_id=None, sn=None, client=None,
+                 retries=3, # Retries for 5xx responses, timeouts and malformed JSON
+                 backoff=0.5, # Base of the exponential backoff between retries, in seconds
+                 breaker=None, # `CircuitBreaker` to share, else one opening after 5 consecutive failures
+                 stale=True, # Whether to fall back to the last successful reading while SolaX is failing
+                 cache=True, # Whether to keep readings until the inverter's next upload
+                 upload_every=300., # Seconds between the inverter's uploads
+                 min_ttl=60., # Shortest time a reading is kept, as SolaX only allows a few calls a minute
+                 swr=600., # Seconds past expiry a reading is still served while a fresh one is fetched in the background
+                 clock=time, # Wall clock, compared with the readings' upload times
+                 metrics=None): # `Metrics` (or anything with its `inc` and `observe`) recording requests and cached readings
         self.token_id = token_id or os.getenv('SOLAX_TOKEN_ID')
         self.sn = sn or os.getenv('SOLAX_SN')
+        self.client = client or make_client()
+        self.retries,self.backoff = retries,backoff
+        self.breaker = breaker or CircuitBreaker()
+        self.stale,self.last = stale,None
+        self.cache,self.upload_every,self.min_ttl,self.swr,self.clock = cache,upload_every,min_ttl,swr,clock
+        self.fresh_until,self.refreshing,self.bg,self.lock = 0.,False,None,threading.Lock()
+        self.metrics = metrics
+
+    def close(self): self.client.close()
+    def __enter__(self): return self
+    def __exit__(self, *args): self.close()
 
 # %% ../nbs/01_solar.ipynb 11
+def _rate_limited(res): return res.get('code') == 104 or 'limit' in str(res.get('exception', '')).lower()
+
+@patch
+def _realtime_attempt(self:SolaX):
+    r = yield from checked(self.client.build_request('get', f'{self.base}/getRealtimeInfo.do', params={'tokenId': self.token_id, 'sn': self.sn}))
+    res = Realtime(parse_json(r))
+    if res.get('success'): return res
+    msg = f"SolaX: {res.get('exception') or 'request failed'}"
+    if _rate_limited(res): raise RateLimited(msg, r.status_code, wait=60)
+    raise TransientError(msg, r.status_code)
+
+def _upload_ts(r):
+    "Upload time of reading `r` in epoch seconds, from `utcDateTime` if SolaX sent it, else `uploadTime` read as local time"
+    try:
+        if r.get('utcDateTime'): return datetime.fromisoformat(r.utcDateTime.replace('Z', '+00:00')).timestamp()
+        return datetime.strptime(r.uploadTime, '%Y-%m-%d %H:%M:%S').timestamp()
+    except (AttributeError, TypeError, ValueError): return None
+
+@patch
+def _expiry(self:SolaX, res):
+    "When `res` goes stale: once the inverter's next upload should be in, but no sooner than `min_ttl` and no later than a full upload interval"
+    now,nxt = self.clock(),self.upload_every+self.upload_grace
+    up = _upload_ts(res.result)
+    return now+nxt if up is None else min(max(up+nxt, now+self.min_ttl), now+nxt)
+
+@patch
+def _fetch_flow(self:SolaX):
+    try: res = yield from retrying(self._realtime_attempt, self.retries, self.breaker, self.backoff, max_wait=0)
+    except (TransientError, CircuitOpen) as e:
+        if isinstance(e, RateLimited): self.fresh_until = self.clock()+e.wait
+        if not self.stale or self.last is None: raise
+        return self.last
+    self.last,self.fresh_until = res,self._expiry(res)
+    return res
+
+@patch
+def _realtime_flow(self:SolaX):
+    now,src = self.clock(),'api'
+    if self.cache and now < self.fresh_until:
+        if self.last is None: raise RateLimited('SolaX: rate limited', wait=self.fresh_until-now)
+        res,src = self.last,'cache'
+    elif self.cache and self.last is not None and now < self.fresh_until+self.swr:
+        res,src = self.last,'stale'
+        self._revalidate()
+    else: res = yield from self._fetch_flow()
+    if self.metrics is not None: self.metrics.inc('solax_readings_total', source=src)
+    return res
+
+@patch
+def _revalidate(self:SolaX):
+    "Fetch a fresh reading in the background, one fetch at a time"
+    with self.lock:
+        if self.refreshing: return
+        self.refreshing = True
+    self.bg = self._spawn(self._fetch_flow())
+
+@patch
+def _spawn(self:SolaX, flow):
+    def run():
+        try: self._drive(flow)
+        except APIError: pass
+        finally: self.refreshing = False
+    th = threading.Thread(target=run, daemon=True)
+    th.start()
+    return th
+
+@patch
+def _drive(self:SolaX, flow):
+    return drive(flow, self.client.send if self.metrics is None else instrumented(self.client.send, self.metrics, 'solax'))
+
 @patch
 def getRealtimeInfo(self:SolaX):
     "Get real-time inverter data (power, yield, battery)"
-    r = xget(f'{self.base}/getRealtimeInfo.do', params={'tokenId': self.token_id, 'sn': self.sn})
-    return dict2obj(r.json())
-
-# %% ../nbs/01_solar.ipynb 17
-def SolarWidget(
-    s, 
-    capacity=5000, # total capacity installed in W
-    xtra_classes='w-[320px]'
-):
-    r = s.getRealtimeInfo().result
-    solar = r.acpower
-    grid = r.feedinpower
-    consumption = solar - grid
-    surplus = grid > 0
-    
-    hour = int(r.uploadTime.split()[1].split(':')[0])
-    is_night = 19 <= hour or hour < 6
-    icon = "☀️" if (solar > 0 or not is_night) else "🌙"
-    
-    return Div(
-        Div(
-            Span("SOLAR", cls="font-display text-xs font-bold text-slate-400 uppercase tracking-widest"),
-            Span(f"{icon} {100*solar/capacity:.0f}%", cls="text-xl"),
-            cls="flex justify-between items-center mb-6"
-        ),
-        Div(
-            Div(
-                Span(f"{solar:.0f}W", cls=f"font-display text-4xl {'text-solar-prod' if solar > 0 else 'text-slate-300'} leading-none"),
-                Span("producing", cls="text-slate-400 text-sm"),
-                cls="flex flex-col"
-            ),
-            Div(
-                Span(f"{consumption:.0f}W", cls=f"font-display text-4xl {'text-temp-real' if surplus else 'text-solar-cons'} leading-none"),
-                Span("using", cls="text-slate-400 text-sm"),
-                cls="flex flex-col"
-            ),
-            cls="flex gap-8"
-        ),
-        Div(
-            Span(f"Today: {r.yieldtoday:.1f} kWh", cls="text-slate-400 text-sm"),
-            Span(f"{'↑ Exporting' if surplus else '↓ Importing'} {abs(grid):.0f}W", cls=f"text-sm {'text-green-500' if surplus else 'text-red-400'}"),
-            cls="mt-auto flex justify-between"
-        ),
-        cls=f"bg-white/85 backdrop-blur-xl border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col transition-transform hover:-translate-y-1 duration-300 aspect-square {xtra_classes}"
-    )
+    return self._drive(self._realtime_flow())
+
+# %% ../nbs/01_solar.ipynb 15
+class AsyncSolaX(SolaX):
+    def __init__(self, *args, client=None, **kwargs): super().__init__(*args, client=client or make_async_client(), **kwargs)
+
+    def _drive(self, flow):
+        return adrive(flow, self.client.send if self.metrics is None else ainstrumented(self.client.send, self.metrics, 'solax'))
+    def _spawn(self, flow):
+        async def run():
+            try: await self._drive(flow)
+            except APIError: pass
+            finally: self.refreshing = False
+        return asyncio.get_running_loop().create_task(run())
+
+    async def close(self):
+        if self.bg is not None: self.bg.cancel()
+        await self.client.aclose()
+    async def __aenter__(self): return self
+    async def __aexit__(self, *args): await self.close()
+
+# %% ../nbs/01_solar.ipynb 18
+_all_ = ['SolarCard', 'SolarWidget', 'AsyncSolarWidget']
+_widgets = _all_ # Resolved lazily by `__getattr__`, still exported by `import *`
+
+def __getattr__(name):
+    "Load the solar widgets from `widgets` on first use"
+    if name not in _widgets: raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from netatmo_thermostat import widgets
+    return getattr(widgets, name)
@@ -0,0 +1,154 @@
+"""A local Netatmo and SolaX Cloud for tests and benchmarks, with configurable latency, errors and payload sizes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/16_standin.ipynb.
+
+# %% auto 0
+__all__ = ['standin_endpoints', 'Standin', 'standin_clients']
+
+# %% ../nbs/16_standin.ipynb 2
+import math, random, asyncio, httpx
+from time import time, localtime, strftime
+from collections import Counter
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from fastcore.basics import patch
+
+from .core import AsyncThermostat, scale_secs
+from .solar import AsyncSolaX
+
+# %% ../nbs/16_standin.ipynb 5
+def _per(v, ep): return v.get(ep, 0) if isinstance(v, dict) else v
+
+class Standin:
+    "In-process stand-in for the Netatmo and SolaX Cloud APIs, as an ASGI app"
+    def __init__(self,
+        homes:int=1, # Homes in `homesdata`
+        rooms:int=4, # Heated rooms per home
+        max_points:int=1024, # Most points a measure call returns
+        latency=0., # Seconds before each answer, or a dict of them by endpoint
+        error_rate=0., # Share of calls answered with a 503, or a dict of them by endpoint
+        token_ttl:int=10800, # `expires_in` of the access tokens handed out
+        seed:int=0): # Seed of the errors' random draws
+        self.homes,self.rooms,self.max_points,self.token_ttl = homes,rooms,max_points,token_ttl
+        self.latency,self.error_rate,self.rng = latency,error_rate,random.Random(seed)
+        self.calls,self.tokens,self.setpoints,self.schedules = Counter(),{'standin'},{},{}
+        self.app = Starlette(routes=[Route('/oauth2/token', self.token, methods=['POST']),
+                                     Route('/api/{endpoint}', self.netatmo, methods=['GET', 'POST']),
+                                     Route('/proxyApp/proxy/api/getRealtimeInfo.do', self.realtime)])
+
+    async def __call__(self, scope, receive, send): await self.app(scope, receive, send)
+
+    async def _delay(self, ep):
+        "Count a call to `ep`, wait its latency, and return a 503 if it's drawn to fail"
+        self.calls[ep] += 1
+        if (w := _per(self.latency, ep)): await asyncio.sleep(w)
+        if self.rng.random() < _per(self.error_rate, ep): return JSONResponse({'error': {'code': 500, 'message': 'stand-in failure'}}, 503)
+
+# %% ../nbs/16_standin.ipynb 7
+def _temp(room, ts): return 20 + sum(map(ord, room)) % 7/10 + 1.5*math.sin(2*math.pi*(ts % 86400)/86400)
+
+def _values(typ, room, sp, ts):
+    if typ == 'temperature': return round(_temp(room, ts), 1)
+    if typ == 'sp_temperature': return sp
+    if typ in ('boileron', 'sum_boiler_on'): return int(max(0., sp - _temp(room, ts))*600)
+    return 0
+
+@patch
+def _room_ids(self:Standin, hid): return [f'r{hid[1:]}-{j}' for j in range(self.rooms)]
+
+@patch
+def _setpoint(self:Standin, hid, r): return self.setpoints.get((hid, r), (19.0, 'schedule'))
+
+@patch
+def _schedule(self:Standin, hid):
+    if hid not in self.schedules:
+        zones = [{'id': z, 'name': n, 'type': z, 'rooms_temp': [{'room_id': r, 'temp': t} for r in self._room_ids(hid)]}
+                 for z,n,t in ((0, 'Comfort', 20.), (1, 'Night', 17.))]
+        timetable = [{'zone_id': z, 'm_offset': day*1440+m} for day in range(7) for m,z in ((0, 1), (420, 0), (1320, 1))]
+        self.schedules[hid] = {'id': f's{hid[1:]}', 'name': 'Stand-in schedule', 'type': 'therm', 'default': True, 'selected': True,
+                               'zones': zones, 'timetable': timetable, 'hg_temp': 7, 'away_temp': 16}
+    return self.schedules[hid]
+
+@patch
+def _homesdata(self:Standin, d):
+    return {'homes': [{'id': f'h{i}', 'name': f'Home {i}',
+                       'rooms': [{'id': r, 'name': f'Room {r}', 'type': 'livingroom', 'module_ids': [f'm{r}']} for r in self._room_ids(f'h{i}')],
+                       'modules': [{'id': f'm{r}', 'type': 'NATherm1', 'room_id': r} for r in self._room_ids(f'h{i}')],
+                       'timezone': 'UTC', 'schedules': [self._schedule(f'h{i}')]}
+                      for i in range(self.homes)]}
+
+@patch
+def _homestatus(self:Standin, d):
+    hid,now = d['home_id'],time()
+    rooms = [{'id': r, 'reachable': True, 'therm_measured_temperature': round(_temp(r, now), 1),
+              'therm_setpoint_temperature': self._setpoint(hid, r)[0], 'therm_setpoint_mode': self._setpoint(hid, r)[1]}
+             for r in self._room_ids(hid)]
+    return {'home': {'id': hid, 'rooms': rooms}}
+
+@patch
+def _measure(self:Standin, d, key, sp):
+    step = scale_secs[d.get('scale', '1hour')]
+    end = int(d.get('date_end') or time())
+    beg = int(d.get('date_begin') or end - step*self.max_points)
+    beg = -(-max(beg, end - step*self.max_points) // step) * step
+    ts = range(beg, end, step)
+    types = d.get('type', 'temperature').split(',')
+    return [{'beg_time': beg, 'step_time': step, 'value': [[_values(t, key, sp, x) for t in types] for x in ts]}] if len(ts) else []
+
+@patch
+def _getroommeasure(self:Standin, d): return self._measure(d, d['room_id'], self._setpoint(d['home_id'], d['room_id'])[0])
+@patch
+def _getmeasure(self:Standin, d): return self._measure(d, d.get('module_id', d['device_id']), 19.0)
+
+@patch
+def _setroomthermpoint(self:Standin, d): self.setpoints[(d['home_id'], d['room_id'])] = (float(d.get('temp', 19.0)), d['mode'])
+
+@patch
+def _synchomeschedule(self:Standin, d):
+    self._schedule(d['home_id']).update({k: d[k] for k in ('zones', 'timetable', 'name', 'hg_temp', 'away_temp') if k in d})
+
+standin_endpoints = ('homesdata', 'homestatus', 'getroommeasure', 'getmeasure', 'setroomthermpoint', 'synchomeschedule')
+
+# %% ../nbs/16_standin.ipynb 9
+@patch
+async def token(self:Standin, req):
+    if (err := await self._delay('token')): return err
+    tok = f'standin-{len(self.tokens)}'
+    self.tokens.add(tok)
+    return JSONResponse({'access_token': tok, 'refresh_token': f'refresh-{len(self.tokens)}', 'expires_in': self.token_ttl})
+
+@patch
+async def netatmo(self:Standin, req):
+    ep = req.path_params['endpoint']
+    if ep not in standin_endpoints: return JSONResponse({'error': {'code': 2, 'message': 'Invalid access'}}, 404)
+    if (err := await self._delay(ep)): return err
+    if req.headers.get('authorization', '').removeprefix('Bearer ') not in self.tokens:
+        return JSONResponse({'error': {'code': 3, 'message': 'Access token expired'}}, 403)
+    json = req.headers.get('content-type') == 'application/json'
+    d = {**req.query_params, **(await req.json() if json else await req.form())}
+    body = getattr(self, f'_{ep}')(d)
+    return JSONResponse({'status': 'ok', 'time_server': int(time()), **({'body': body} if body is not None else {})})
+
+@patch
+async def realtime(self:Standin, req):
+    if (err := await self._delay('getRealtimeInfo')): return err
+    now = time()
+    up = now - now % 300
+    sun = max(0., math.sin(2*math.pi*((up % 86400)/86400 - .25)))
+    acpower = round(4000*sun, 1)
+    return JSONResponse({'success': True, 'exception': 'Query success!', 'code': 0, 'result': {
+        'inverterSN': 'STANDIN', 'sn': req.query_params.get('sn', 'SN'), 'acpower': acpower, 'feedinpower': round(acpower - 700, 1),
+        'yieldtoday': round(16*sun, 1), 'yieldtotal': 12345.6, 'uploadTime': strftime('%Y-%m-%d %H:%M:%S', localtime(up))}})
+
+# %% ../nbs/16_standin.ipynb 10
+def standin_clients(
+    app=None, # `Standin` (or other ASGI app) to talk to in-process, default a new `Standin()`
+    base='http://standin', # URL of the stand-in, e.g. one served with uvicorn
+    **kwargs): # Extra args for `AsyncThermostat`, e.g. `cache=False`
+    "`AsyncThermostat` and `AsyncSolaX` talking to a stand-in, through `httpx.ASGITransport` when given `app`"
+    mk = (lambda: httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url=base)) if app is not None else (lambda: None)
+    t = AsyncThermostat('id', 'secret', access_token='standin', refresh_token='refresh', client=mk(), **kwargs)
+    s = AsyncSolaX('tok', 'SN', client=mk())
+    t.base,s.base = base,f'{base}/proxyApp/proxy/api'
+    return t, s
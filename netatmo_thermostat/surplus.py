@@ -0,0 +1,122 @@
+"""Boost room setpoints while the panels export power, and replay recorded days to tune it"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/20_surplus.ipynb.
+
+# %% auto 0
+__all__ = ['SurplusController', 'surplus_step', 'replay']
+
+# %% ../nbs/20_surplus.ipynb 2
+import numpy as np
+from math import inf
+from collections import Counter
+from fastcore.basics import AttrDict
+
+from .ratelimit import TokenBucket
+from .solar import _upload_ts
+
+# %% ../nbs/20_surplus.ipynb 5
+class SurplusController:
+    "Boosts rooms' setpoints while the inverter exports power, with hysteresis, hold times and a write budget"
+    def __init__(self,
+        rooms:list, # Room IDs that may be boosted
+        on_w:float=800., # Smoothed export (W) that starts boosting
+        off_w:float=200., # Smoothed export (W) that stops it
+        room_w:float=1000., # Export (W) per boosted room
+        boost:float=1.5, # °C added to the scheduled setpoint
+        max_temp:float=23., # Highest boosted setpoint
+        hold:int=1800, # Seconds before a room's boost may change again
+        duration:int=3600, # Seconds each boost lasts unless renewed
+        budget:tuple=(6, 3600), # `(writes, seconds)` allowed
+        alpha:float=.5): # Weight of the newest sample in the smoothed export
+        self.rooms,self.on_w,self.off_w,self.room_w,self.alpha = list(rooms),on_w,off_w,room_w,alpha
+        self.boost,self.max_temp,self.hold,self.duration = boost,max_temp,hold,duration
+        self.bucket = TokenBucket(*budget)
+        self.export,self.active,self.last = None,False,None
+        self.boosts,self.changed,self.stats = {},{},Counter()
+
+    def __repr__(self): return f'SurplusController({len(self.boosts)}/{len(self.rooms)} rooms boosted, export {self.export}W)'
+
+    def _held(self, room, ts): return ts - self.changed.get(room, -inf) >= self.hold
+
+    def _write(self, ts, action, acts):
+        if self.bucket.wait(ts) > 0: self.stats['deferred'] += 1; return False
+        self.bucket.take(ts)
+        acts.append(action)
+        self.stats['writes'] += 1
+        return True
+
+    def _wanted(self, temps, setpoints):
+        if not self.active: return {}
+        targets = {}
+        for r in self.rooms:
+            sp,temp = setpoints.get(r),temps.get(r)
+            if sp is None or temp is None: continue
+            target = round(min(sp+self.boost, self.max_temp)*2)/2
+            if target > sp and (r in self.boosts or temp < target): targets[r] = target
+        order = sorted(targets, key=lambda r: (r not in self.boosts, temps[r]-targets[r]))
+        return {r: targets[r] for r in order[:max(1, int(self.export//self.room_w))]}
+
+    def update(self,
+        ts:float, # Sample time, e.g. the reading's upload time
+        feedin:float, # Power exported to the grid (W), negative when importing
+        temps:dict, # Measured temperature by room ID
+        setpoints:dict): # Scheduled setpoint by room ID
+        "Evaluate a new sample, returning the `setroomthermpoint` arguments to send as `(room_id, mode, temp, endtime)`"
+        if self.last is not None and ts <= self.last: return []
+        self.last = ts
+        self.export = feedin if self.export is None else self.alpha*feedin + (1-self.alpha)*self.export
+        self.active = self.export > self.off_w if self.active else self.export >= self.on_w
+        for r,(_,until) in list(self.boosts.items()):
+            if until <= ts: del self.boosts[r]; self.changed[r] = ts
+        want,acts = self._wanted(temps, setpoints),[]
+        for r in [r for r in self.boosts if r not in want and self._held(r, ts)]:
+            if self._write(ts, (r, 'home', None, None), acts): del self.boosts[r]; self.changed[r] = ts
+        for r,target in want.items():
+            cur = self.boosts.get(r)
+            if cur is None and not self._held(r, ts): continue
+            if cur is not None and cur[0] == target and cur[1]-ts > self.duration/4: continue
+            if self._write(ts, (r, 'manual', target, int(ts+self.duration)), acts):
+                if cur is None: self.changed[r] = ts
+                self.boosts[r] = target,ts+self.duration
+        return acts
+
+# %% ../nbs/20_surplus.ipynb 13
+async def surplus_step(
+    ctrl:SurplusController, # Controller for the home's rooms
+    t, # `AsyncThermostat`
+    s, # `AsyncSolaX`
+    home_id:str, # Home ID
+    schedule): # The home's `WeekSchedule`
+    "Evaluate the latest SolaX reading with `ctrl` and send its writes, returning them"
+    r = (await s.getRealtimeInfo()).result
+    ts = _upload_ts(r)
+    if ts is None or (ctrl.last is not None and ts <= ctrl.last): return []
+    temps = {x.id: x.get('therm_measured_temperature') for x in (await t.homestatus(home_id)).home.rooms}
+    acts = ctrl.update(ts, r.get('feedinpower') or 0., temps, {rid: schedule.temp_at(rid, ts) for rid in ctrl.rooms})
+    for a in acts: await t.setroomthermpoint(home_id, *a)
+    return acts
+
+# %% ../nbs/20_surplus.ipynb 16
+def replay(
+    ctrl:SurplusController, # Controller to evaluate, fresh or carrying on from its current state
+    ts, # Sample timestamps
+    feedin, # Export (W) at each timestamp
+    temps, # `(rooms, n)` recorded room temperatures, or `(rooms,)` starting ones with `model`
+    setpoints, # Scheduled setpoints, `(rooms, n)`, `(rooms,)` or one for all
+    model=None): # `ThermalModel` simulating the rooms' response to the setpoints
+    "Run recorded samples through `ctrl`, returning its `actions` and each room's `temps`, effective `setpoints` and `on` at each sample"
+    ts,feedin = np.asarray(ts),np.asarray(feedin, float)
+    shape = (len(ctrl.rooms), len(ts))
+    temps = np.asarray(temps, float).reshape(len(ctrl.rooms), -1)
+    sps = np.asarray(setpoints, float)
+    sps = np.broadcast_to(sps if sps.ndim == 2 else sps.reshape(-1, 1), shape)
+    T,eff,actions = np.empty(shape),np.array(sps),[]
+    for i,t in enumerate(ts.tolist()):
+        if model is None: T[:, i] = temps[:, i]
+        elif i == 0: T[:, 0] = temps[:, 0]
+        else: T[:, i] = T[:, i-1] + model.rate(T[:, i-1], T[:, i-1] < eff[:, i-1])*(ts[i]-ts[i-1])/3600
+        acts = ctrl.update(t, feedin[i], dict(zip(ctrl.rooms, T[:, i])), dict(zip(ctrl.rooms, sps[:, i])))
+        actions += [(t, *a) for a in acts]
+        for j,r in enumerate(ctrl.rooms):
+            if r in ctrl.boosts: eff[j, i] = ctrl.boosts[r][0]
+    return AttrDict(actions=actions, temps=T, setpoints=eff, on=eff != sps)
@@ -0,0 +1,97 @@
+"""A fixed-size history of SolaX readings, with daily rollups"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/14_telemetry.ipynb.
+
+# %% auto 0
+__all__ = ['solar_fields', 'daily_fields', 'SolarLog']
+
+# %% ../nbs/14_telemetry.ipynb 2
+import os
+import inspect
+import numpy as np
+
+from datetime import datetime
+from fastcore.basics import patch
+
+from .solar import _upload_ts
+
+# %% ../nbs/14_telemetry.ipynb 5
+solar_fields = ('acpower', 'feedinpower', 'yieldtoday')
+
+class SolarLog:
+    "The last `size` SolaX readings in one NumPy array, a row of `ts` and `solar_fields` each"
+    def __init__(self,
+        size:int=8640, # Readings kept, a month of uploads every 5 minutes
+        path:str=None): # `.npy` file the readings are memory-mapped to, so they survive restarts
+        shape = (size, 1+len(solar_fields))
+        if path and os.path.exists(path): self.buf = np.load(path, mmap_mode='r+')
+        elif path: self.buf = np.lib.format.open_memmap(path, 'w+', np.float64, shape)
+        else: self.buf = np.zeros(shape)
+        self.shared = isinstance(self.buf, np.memmap)
+        self.sync()
+
+    def __len__(self): return self.n
+    def __repr__(self): return f'SolarLog({self.n}/{len(self.buf)} readings)'
+
+    def sync(self):
+        "Find the write position again from the newest timestamp, picking up readings other processes added to `path`"
+        ts = self.buf[:, 0]
+        self.n = int((ts > 0).sum())
+        self.head = (int(ts.argmax())+1) % len(self.buf) if self.n else 0
+
+    def append(self, ts, *vals):
+        "Add a reading taken at `ts`, unless it isn't newer than the last one"
+        if self.shared: self.sync()
+        if self.n and ts <= self.buf[self.head-1, 0]: return False
+        self.buf[self.head] = (ts, *vals)
+        self.head,self.n = (self.head+1) % len(self.buf),min(self.n+1, len(self.buf))
+        return True
+
+    def record(self, r):
+        "Add `r`, the `result` of a `getRealtimeInfo` response, once per upload"
+        ts = _upload_ts(r)
+        return ts is not None and self.append(ts, *(r.get(f) or 0. for f in solar_fields))
+
+    def arrays(self, span=None):
+        "Timestamps (int64 seconds) and an `(n, 3)` array of `solar_fields`, in time order, for the last `span` seconds"
+        if self.shared: self.sync()
+        a = self.buf[:self.head] if self.n < len(self.buf) else np.concatenate([self.buf[self.head:], self.buf[:self.head]])
+        if span is not None and len(a): a = a[a[:, 0].searchsorted(a[-1, 0]-span):]
+        return a[:, 0].astype(np.int64), np.array(a[:, 1:])
+
+    def flush(self):
+        "Write pending readings to `path`"
+        if self.shared: self.buf.flush()
+
+# %% ../nbs/14_telemetry.ipynb 10
+@patch
+def poll(self:SolarLog, s):
+    "Fetch a reading with `SolaX` or `AsyncSolaX` `s` and record it, returning the response"
+    res = s.getRealtimeInfo()
+    if not inspect.isawaitable(res):
+        self.record(res.result)
+        return res
+    async def _rec():
+        r = await res
+        self.record(r.result)
+        return r
+    return _rec()
+
+# %% ../nbs/14_telemetry.ipynb 13
+daily_fields = ('day', 'yield_kwh', 'peak_w', 'produced_kwh', 'used_kwh', 'export_kwh', 'import_kwh')
+
+@patch
+def daily(self:SolarLog,
+    utcoffset:int=None, # Seconds east of UTC of the days' midnights, default the server's
+    max_gap:int=900): # Longest a reading counts for, in seconds
+    "A record array with a row of `daily_fields` per day in the log"
+    ts,v = self.arrays()
+    if utcoffset is None: utcoffset = datetime.now().astimezone().utcoffset().total_seconds()
+    day = (ts + int(utcoffset))//86400
+    starts = np.flatnonzero(np.r_[True, day[1:] != day[:-1]]) if len(ts) else np.zeros(0, dtype=int)
+    hrs = np.minimum(np.diff(ts, append=ts[-1:]), max_gap)/3600
+    prod,grid = v[:, 0],v[:, 1]
+    kwh = np.stack([prod, prod-grid, np.maximum(grid, 0), np.maximum(-grid, 0)], 1)*hrs[:, None]/1000
+    sums = np.add.reduceat(kwh, starts) if len(ts) else np.zeros((0, 4))
+    maxs = [np.maximum.reduceat(c, starts) if len(ts) else c for c in (v[:, 2], prod)]
+    return np.rec.fromarrays([day[starts].astype('datetime64[D]'), *maxs, *sums.T], names=daily_fields)
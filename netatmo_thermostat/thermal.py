@@ -0,0 +1,107 @@
+"""How fast each room warms and cools, learnt from its history, to predict preheat times"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/19_thermal.ipynb.
+
+# %% auto 0
+__all__ = ['align', 'ThermalModel', 'thermal_history']
+
+# %% ../nbs/19_thermal.ipynb 2
+import numpy as np
+from fastcore.basics import patch
+
+from .core import scale_secs
+
+# %% ../nbs/19_thermal.ipynb 5
+def align(
+    series, # `(timestamps, values)` pairs, e.g. from `HistoryStore.roommeasure`
+    step:int): # Seconds between grid points
+    "Grid timestamps and a `(len(series), n)` array of the series' values on it, NaN where missing"
+    series = [(np.asarray(t), np.asarray(v, float)) for t,v in series]
+    ts = [t for t,_ in series if len(t)]
+    if not ts: return np.zeros(0, np.int64), np.full((len(series), 0), np.nan)
+    beg,end = min(t[0] for t in ts),max(t[-1] for t in ts)
+    grid = np.arange(beg, end+step//2+1, step, dtype=np.int64)
+    out = np.full((len(series), len(grid)), np.nan)
+    for row,(t,v) in zip(out, series): row[np.rint((t-beg)/step).astype(int)] = v
+    return grid, out
+
+# %% ../nbs/19_thermal.ipynb 8
+class ThermalModel:
+    "Per-room linear model of warming with the boiler on and cooling with it off, fit incrementally from history"
+    def __init__(self,
+        rooms, # Room IDs, in the order of the rows of the arrays passed in and returned
+        step:int=1800, # Seconds between samples, `scale_secs` of the history's scale
+        ridge:float=1e-3): # Regularization of the least squares fit
+        self.rooms,self.step,self.ridge = list(rooms),step,ridge
+        r = len(self.rooms)
+        self.xtx,self.xty,self.n = np.zeros((r, 3, 3)),np.zeros((r, 3)),np.zeros(r, np.int64)
+        self.last = None
+
+    def __repr__(self): return f'ThermalModel({len(self.rooms)} rooms, {self.n.sum()} samples)'
+
+    def update(self,
+        ts, # Timestamps `step` seconds apart (gaps are skipped)
+        temps, # `(rooms, n)` room temperatures, NaN where missing
+        duty): # Boiler duty cycle in [0, 1] during the step from each timestamp, `(n,)` or `(rooms, n)`
+        "Add samples to the fit"
+        ts,temps = np.asarray(ts),np.asarray(temps, float).reshape(len(self.rooms), -1)
+        duty = np.broadcast_to(np.asarray(duty, float), temps.shape)
+        if not len(ts): return self
+        if self.last is not None:
+            t0,T0,d0 = self.last
+            ts,temps,duty = np.r_[t0, ts],np.c_[T0, temps],np.c_[d0, duty]
+        self.last = ts[-1],temps[:, -1],duty[:, -1]
+        dt = np.diff(ts)
+        T = temps[:, :-1]
+        y = np.diff(temps)/(dt/3600)
+        ok = ~np.isnan(y) & ~np.isnan(duty[:, :-1]) & (dt == self.step)
+        X = np.stack([np.where(ok, duty[:, :-1], 0.), ok.astype(float), np.where(ok, T, 0.)], 1)
+        self.xtx += X @ X.transpose(0, 2, 1)
+        self.xty += (X @ np.where(ok, y, 0.)[..., None])[..., 0]
+        self.n += ok.sum(1)
+        return self
+
+    @property
+    def coef(self):
+        "`(rooms, 3)` array of `a`, `b_0` and `b_1`"
+        return np.linalg.solve(self.xtx + self.ridge*np.eye(3), self.xty[..., None])[..., 0]
+
+# %% ../nbs/19_thermal.ipynb 14
+@patch
+def rate(self:ThermalModel, temps, duty=1.):
+    "Warming rate of each room in °C per hour at `temps` with the boiler at `duty`"
+    a,b0,b1 = self.coef.T
+    return a*duty + b0 + b1*np.asarray(temps, float)
+
+@patch
+def preheat(self:ThermalModel, temps, setpoints, duty=1.):
+    "Hours each room takes to warm from `temps` to `setpoints` with the boiler at `duty`: 0 if already there, `inf` if never"
+    a,b0,b1 = self.coef.T
+    T,sp = np.asarray(temps, float),np.asarray(setpoints, float)
+    c = a*duty + b0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        h = np.where(np.abs(b1) < 1e-9, (sp-T)/(c+b1*T), np.log((sp+c/b1)/(T+c/b1))/b1)
+    return np.where(sp <= T, 0., np.where(np.isfinite(h) & (h > 0), h, np.inf))
+
+@patch
+def runtime_per_degree(self:ThermalModel, temps):
+    "Hours of boiler time per °C of warming at `temps`, `inf` where the boiler can't warm the room"
+    r = self.rate(temps)
+    with np.errstate(divide='ignore'): return np.where(r > 0, 1/r, np.inf)
+
+# %% ../nbs/19_thermal.ipynb 17
+def thermal_history(
+    store, # `HistoryStore`
+    home_id:str, # Home ID
+    room_ids:list, # Room IDs
+    device_id:str, # Relay MAC address
+    module_id:str=None, # Thermostat MAC address, whose `boileron` is read
+    scale:str='30min', # Time scale
+    begin:int=None, # Start timestamp, default a week before `end`
+    end:int=None): # End timestamp, default now
+    "Timestamps, `(rooms, n)` temperatures and the boiler duty cycle on one grid, for `ThermalModel.update`"
+    step = scale_secs[scale]
+    rooms = [store.roommeasure(home_id, r, 'temperature', scale, begin, end) for r in room_ids]
+    boiler = store.measure(device_id, module_id, 'boileron', scale, begin, end)
+    ts,a = align([*rooms, boiler], step)
+    return ts, a[:-1], np.clip(a[-1]/step, 0, 1)
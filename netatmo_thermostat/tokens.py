@@ -0,0 +1,48 @@
+"""Durable OAuth token storage shared between processes"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/08_tokens.ipynb.
+
+# %% auto 0
+__all__ = ['TokenStore']
+
+# %% ../nbs/08_tokens.ipynb 2
+import os, json, tempfile
+from pathlib import Path
+try: import fcntl
+except ImportError: fcntl = None
+
+# %% ../nbs/08_tokens.ipynb 5
+class TokenStore:
+    "OAuth tokens persisted as JSON at `path`, replaced atomically and guarded by a cross-process lock"
+    def __init__(self, path='netatmo_tokens.json'):
+        self.path = Path(path)
+        self.lock_path = self.path.with_name(self.path.name+'.lock')
+        self.fd = None
+
+    def load(self):
+        "Stored tokens, or `None` if none were saved yet"
+        try: return json.loads(self.path.read_text())
+        except (FileNotFoundError, ValueError): return None
+
+    def save(self, tokens):
+        "Atomically replace the stored tokens"
+        fd,tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f'.{self.path.name}.')
+        try:
+            with os.fdopen(fd, 'w') as f: json.dump(tokens, f); f.flush(); os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        except BaseException: os.unlink(tmp); raise
+
+    def try_lock(self):
+        "Take the refresh lock if no other process holds it, returning whether we got it"
+        if fcntl is None: return True
+        fd = os.open(self.lock_path, os.O_RDWR|os.O_CREAT, 0o600)
+        try: fcntl.flock(fd, fcntl.LOCK_EX|fcntl.LOCK_NB)
+        except BlockingIOError: os.close(fd); return False
+        self.fd = fd
+        return True
+
+    def unlock(self):
+        "Release the refresh lock"
+        if self.fd is None: return
+        fcntl.flock(self.fd, fcntl.LOCK_UN); os.close(self.fd)
+        self.fd = None
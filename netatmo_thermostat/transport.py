@@ -0,0 +1,62 @@
+"""Pooled, keep-alive HTTP clients shared by the API clients"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/02_transport.ipynb.
+
+# %% auto 0
+__all__ = ['make_client', 'make_async_client', 'drive', 'adrive']
+
+# %% ../nbs/02_transport.ipynb 2
+import time, asyncio, httpx
+from fastcore.meta import delegates
+
+# %% ../nbs/02_transport.ipynb 5
+def make_client(
+    http2:bool=False,          # Negotiate HTTP/2 (needs the optional `h2` package)
+    max_connections:int=10,    # Max open connections in the pool
+    max_keepalive:int=5,       # Max idle connections kept alive
+    keepalive_expiry:float=30, # Seconds an idle connection is kept open
+    timeout:float=10,          # Connect/read/write/pool timeout in seconds
+    cls=httpx.Client,          # Client class to build, e.g. `httpx.AsyncClient`
+    **kwargs,                  # Extra args passed to `cls`
+)->httpx.Client:
+    "A pooled, keep-alive `httpx.Client` for one API backend"
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_keepalive, keepalive_expiry=keepalive_expiry)
+    return cls(http2=http2, limits=limits, timeout=timeout, **kwargs)
+
+# %% ../nbs/02_transport.ipynb 8
+@delegates(make_client, but=['cls'])
+def make_async_client(**kwargs)->httpx.AsyncClient:
+    "Like `make_client`, but returns a pooled `httpx.AsyncClient` for the async API clients"
+    return make_client(cls=httpx.AsyncClient, **kwargs)
+
+# %% ../nbs/02_transport.ipynb 10
+try: from orjson import loads as json_loads
+except ImportError: from json import loads as json_loads
+
+# %% ../nbs/02_transport.ipynb 13
+def drive(flow, send):
+    "Run `flow` to completion, passing each yielded request to `send` (or sleeping on a yielded number) and returning the flow's result"
+    r,err = None,None
+    try:
+        while True:
+            x = flow.throw(err) if err else flow.send(r)
+            r,err = None,None
+            if isinstance(x, (int, float)): time.sleep(x)
+            else:
+                try: r = send(x)
+                except httpx.TransportError as e: err = e
+    except StopIteration as e: return e.value
+
+# %% ../nbs/02_transport.ipynb 14
+async def adrive(flow, send):
+    "Async version of `drive`, awaiting each `send` and `asyncio.sleep`"
+    r,err = None,None
+    try:
+        while True:
+            x = flow.throw(err) if err else flow.send(r)
+            r,err = None,None
+            if isinstance(x, (int, float)): await asyncio.sleep(x)
+            else:
+                try: r = await send(x)
+                except httpx.TransportError as e: err = e
+    except StopIteration as e: return e.value
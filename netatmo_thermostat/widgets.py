@@ -0,0 +1,387 @@
+"""FastHTML/MonsterUI components for the thermostat and solar dashboards"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/12_widgets.ipynb.
+
+# %% auto 0
+__all__ = ['room_history', 'ControlBtn', 'SetpointDisplay', 'MeasuredTemp', 'to_chart', 'TempChart', 'ThermostatCard',
+           'thermostat_fragments', 'ThermostatWidget', 'ThermostatGrid', 'AsyncThermostatWidget', 'AsyncThermostatGrid',
+           'Skeleton', 'LazyWidget', 'setpoint_writes', 'setup_setpoint_route', 'setup_thermostat_widget',
+           'setup_thermostat_grid', 'SolarChart', 'SolarCard', 'SolarWidget', 'AsyncSolarWidget', 'setup_solar_widget']
+
+# %% ../nbs/12_widgets.ipynb 3
+import json
+import asyncio
+import numpy as np
+
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+from time import time
+
+from fasthtml.common import *
+from monsterui.all import *
+
+from .core import AsyncThermostat, _heated_rooms
+from .solar import SolaX, AsyncSolaX
+from .resilience import APIError
+from .telemetry import SolarLog
+from .series import measure_arrays, lttb
+from .writes import WriteCoalescer
+from .render import FragmentCache, conditional, data_key
+
+# %% ../nbs/12_widgets.ipynb 8
+def _rid(base, room_id): return f"{base}-{room_id}" if room_id else base
+
+def ControlBtn(text, change, current_temp, home_id=None, room_id=None, **kwargs):
+    vals = {'change': change, 'current_setpoint': current_temp}
+    if home_id: vals['home_id'] = home_id
+    if room_id: vals['room_id'] = room_id
+    return Button(text, 
+        hx_post="/setpoint", 
+        hx_vals=json.dumps(vals),
+        hx_target=f"#{_rid('setpoint-display', room_id)}",
+        hx_swap="outerHTML",
+        cls="w-10 h-10 rounded-full border border-black/5 bg-white/50 text-slate-700 text-lg flex items-center justify-center hover:bg-white hover:scale-105 transition-all shadow-sm cursor-pointer",
+        **{'id': _rid('btn-minus' if change < 0 else 'btn-plus', room_id), **kwargs}
+    )
+
+def SetpointDisplay(temp, room_id=None):
+    return Span(
+        "Target ", Span(f"{temp}°", cls="text-temp-set font-semibold"),
+        id=_rid("setpoint-display", room_id),
+        cls="text-slate-500 font-medium text-base"
+    )
+
+def MeasuredTemp(temp, room_id=None): return Span(f"{temp}°", id=_rid("measured-temp", room_id), cls="font-display text-6xl text-temp-real leading-none")
+
+# %% ../nbs/12_widgets.ipynb 9
+def to_chart(raw, points:int=None, col:int=0):
+    "ApexCharts `[ms, value]` pairs for every segment of a measure response, downsampled to `points` with `lttb`"
+    return _pairs(*measure_arrays(raw, col), points)
+
+def _pairs(ts, vs, points=None):
+    keep = ~np.isnan(vs)
+    ts,vs = ts[keep],vs[keep]
+    if points: ts,vs = lttb(ts, vs, points)
+    return list(map(list, zip((ts*1000).tolist(), vs.tolist())))
+
+# %% ../nbs/12_widgets.ipynb 12
+def TempChart(temps_raw, sp_raw=None, points=300):
+    "Temperature and setpoint chart, from separate measures or a single `room_history` one with both"
+    if sp_raw is None: sp_raw,sp_col = temps_raw,1
+    else: sp_col = 0
+    return ApexChart(opts={
+        'chart': {'type': 'area', 'height': 150, 'sparkline': {'enabled': True}},
+        'series': [
+            {'name': 'Temp', 'data': to_chart(temps_raw, points)},
+            {'name': 'Setpoint', 'data': to_chart(sp_raw, points, sp_col)}
+        ],
+        'xaxis': {'type': 'datetime'},
+        'stroke': {'curve': ['smooth', 'stepline'], 'width': [3, 2], 'dashArray': [0, 5]},
+        'colors': ['#00b894', '#e17055'],
+        'fill': {'type': 'gradient', 'gradient': {'opacityFrom': 0.15, 'opacityTo': 0}}
+    })
+
+# %% ../nbs/12_widgets.ipynb 13
+room_history = 'temperature,sp_temperature'
+
+def ThermostatCard(room, temps_raw, sp_raw=None, xtra_classes='w-[320px]', home_id=None, name="CLIMATE"):
+    sp,rid = room.therm_setpoint_temperature,room.id
+    
+    return Div(
+        Div(
+            Span(name, cls="font-display text-xs font-bold text-slate-400 uppercase tracking-widest"),
+            Div(
+                ControlBtn("−", -0.5, sp, home_id, rid),
+                ControlBtn("+", 0.5, sp, home_id, rid), cls="flex gap-2"),
+            cls="flex justify-between items-center mb-6"
+        ),
+        Div(
+            MeasuredTemp(room.therm_measured_temperature, rid),
+            SetpointDisplay(sp, rid),
+            cls="flex items-baseline gap-3 flex-wrap"
+        ),
+        Div(TempChart(temps_raw, sp_raw), cls="mt-auto -mx-3 h-[150px]"),
+        cls=f"bg-white/85 backdrop-blur-xl border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col h-full transition-transform hover:-translate-y-1 duration-300 aspect-square {xtra_classes}"
+    )
+
+def _find_room(status, room_id): return [r for r in status.home.rooms if r.id == room_id][0]
+
+def _room_fragments(room, home_id):
+    sp = room.therm_setpoint_temperature
+    return (MeasuredTemp(room.therm_measured_temperature, room.id), SetpointDisplay(sp, room.id),
+            ControlBtn("−", -0.5, sp, home_id, room.id), ControlBtn("+", 0.5, sp, home_id, room.id))
+
+def thermostat_fragments(status, room_id=None):
+    "The parts of the `ThermostatCard`s of `room_id` (default: every heated room) that change with `homestatus`, for live updates"
+    rooms = [_find_room(status, room_id)] if room_id else _heated_rooms(status)
+    return tuple(f for r in rooms for f in _room_fragments(r, status.home.id))
+
+def _room_data(t, home_id, room_id):
+    raw = t.getroommeasure(home_id, room_id, type=room_history)
+    return _find_room(t.homestatus(home_id), room_id), raw
+
+def ThermostatWidget(t, home_id, room_id, xtra_classes='w-[320px]'):
+    room, raw = _room_data(t, home_id, room_id)
+    return ThermostatCard(room, raw, None, xtra_classes, home_id)
+
+def _room_names(hd): return {r.id: r.get('name', 'CLIMATE') for h in hd.homes for r in h.get('rooms', [])}
+
+def _grid_data(t, home_ids=None, workers=8):
+    "`(home_id, name, room, history)` of every heated room of `home_ids` (default: all), fetched on `workers` threads"
+    hd = t.homesdata()
+    names,home_ids = _room_names(hd),home_ids or [h.id for h in hd.homes]
+    with ThreadPoolExecutor(workers) as ex:
+        sts = list(ex.map(t.homestatus, home_ids))
+        rooms = [(hid, r) for hid,st in zip(home_ids, sts) for r in _heated_rooms(st)]
+        raws = list(ex.map(lambda hr: t.getroommeasure(hr[0], hr[1].id, type=room_history), rooms))
+    return [(hid, names.get(r.id, 'CLIMATE'), r, raw) for (hid,r),raw in zip(rooms, raws)]
+
+def _grid(rooms, xtra_classes='w-[320px]', cls="grid grid-cols-1 md:grid-cols-2 gap-6"):
+    return Div(*[ThermostatCard(r, raw, None, xtra_classes, hid, name) for hid,name,r,raw in rooms], cls=cls)
+
+def ThermostatGrid(t, home_ids=None, xtra_classes='w-[320px]', cls="grid grid-cols-1 md:grid-cols-2 gap-6"):
+    "A `ThermostatCard` for every heated room of `home_ids` (default: all), with one `homestatus` per home and one history call per room, run on a thread pool"
+    return _grid(_grid_data(t, home_ids), xtra_classes, cls)
+
+# %% ../nbs/12_widgets.ipynb 15
+async def _aroom_data(t, home_id, room_id):
+    raw, status = await asyncio.gather(t.getroommeasure(home_id, room_id, type=room_history), t.homestatus(home_id))
+    return _find_room(status, room_id), raw
+
+async def AsyncThermostatWidget(t, home_id, room_id, xtra_classes='w-[320px]'):
+    room, raw = await _aroom_data(t, home_id, room_id)
+    return ThermostatCard(room, raw, None, xtra_classes, home_id)
+
+async def _agrid_data(t, home_ids=None):
+    hd = await t.homesdata()
+    names = _room_names(hd)
+    home_ids = home_ids or [h.id for h in hd.homes]
+    sts = await asyncio.gather(*[t.homestatus(hid) for hid in home_ids])
+    rooms = [(hid, r) for hid,st in zip(home_ids, sts) for r in _heated_rooms(st)]
+    raws = await asyncio.gather(*[t.getroommeasure(hid, r.id, type=room_history) for hid,r in rooms])
+    return [(hid, names.get(r.id, 'CLIMATE'), r, raw) for (hid,r),raw in zip(rooms, raws)]
+
+async def AsyncThermostatGrid(t, home_ids=None, xtra_classes='w-[320px]', cls="grid grid-cols-1 md:grid-cols-2 gap-6"):
+    "Async `ThermostatGrid`: every home's `homestatus` at once, then every room's history at once"
+    return _grid(await _agrid_data(t, home_ids), xtra_classes, cls)
+
+# %% ../nbs/12_widgets.ipynb 22
+def Skeleton(xtra_classes='w-[320px]'):
+    "Pulsing placeholder card shown until a lazy widget loads"
+    return Div(Div(cls="h-3 w-20 rounded-full bg-slate-200 mb-6"), Div(cls="h-12 w-28 rounded-2xl bg-slate-200"),
+               Div(cls="mt-auto h-[150px] rounded-2xl bg-slate-100"),
+               cls=f"bg-white/85 border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col aspect-square animate-pulse {xtra_classes}")
+
+def LazyWidget(
+    path, # Route rendering the widget
+    every=None, # Seconds between refreshes, default load once
+    placeholder=None, # Shown until the widget loads, default a `Skeleton`
+    **kwargs, # Extra attributes of the slot
+):
+    "Slot that loads the widget at `path` into itself once the page is shown, then every `every` seconds"
+    trigger = f"load, every {every}s" if every else "load"
+    return Div(placeholder or Skeleton(), hx_get=path, hx_trigger=trigger, hx_swap="innerHTML", **kwargs)
+
+def _retry(path, placeholder=None, delay=30, **kwargs):
+    "What a widget route answers when its upstream fails: the placeholder, loading `path` again in `delay` seconds in its own place"
+    return Div(placeholder or Skeleton(), hx_get=path, hx_trigger=f"load delay:{delay}s", hx_swap="outerHTML", **kwargs)
+
+async def _fetch(client, sync, asynchronous, *args):
+    "`asynchronous(client, *args)` for async clients, `sync` in a worker thread for blocking ones"
+    if isinstance(client, (AsyncThermostat, AsyncSolaX)): return await asynchronous(client, *args)
+    return await asyncio.to_thread(sync, client, *args)
+
+def _timed(metrics, widget, phase):
+    "Time a phase (`fetch` from upstream or `render` to HTML) of building `widget` in `metrics`' `widget_seconds`"
+    return nullcontext() if metrics is None else metrics.time('widget_seconds', widget=widget, phase=phase)
+
+def _watch(metrics, frags, path):
+    if metrics is not None: metrics.watch(frags.cache, path)
+    return frags
+
+# %% ../nbs/12_widgets.ipynb 24
+def setpoint_writes(t, window=1.):
+    "`WriteCoalescer` for `t.setroomthermpoint`, keyed by `(home_id, room_id)`"
+    write = t.setroomthermpoint if isinstance(t, AsyncThermostat) else partial(asyncio.to_thread, t.setroomthermpoint)
+    return WriteCoalescer(write, window)
+
+def setup_setpoint_route(
+    rt, # FastHTML route decorator from fast_app()
+    t,  # Thermostat instance (authenticated)
+    writes=None, # `WriteCoalescer` for the setpoint writes, default `setpoint_writes(t)`
+):
+    "Register the `/setpoint` route the `ControlBtn`s of every room post to, returning its `WriteCoalescer`"
+    writes = writes or setpoint_writes(t)
+    @rt("/setpoint")
+    async def post(home_id: str, room_id: str, change: float, current_setpoint: float):
+        new_temp = round(current_setpoint + change, 1)
+        writes.submit((home_id, room_id), home_id, room_id, 'manual', new_temp, int(time() + 3600))
+        return (SetpointDisplay(new_temp, room_id),
+                ControlBtn("−", -0.5, new_temp, home_id, room_id, hx_swap_oob="true"),
+                ControlBtn("+", 0.5, new_temp, home_id, room_id, hx_swap_oob="true"))
+    return writes
+
+def setup_thermostat_widget(
+    rt,        # FastHTML route decorator from fast_app()
+    t,         # Thermostat instance (authenticated)
+    home_id,   # Netatmo home ID
+    room_id,   # Room ID to control
+    writes=None, # `WriteCoalescer` for the setpoint writes, default `setpoint_writes(t)`; the slot keeps it as `writes_`
+    every=None, # Seconds between refreshes of the widget, default load once
+    metrics=None, # `Metrics` timing the route's upstream calls and rendering
+    **kwargs,  # Extra args to pass to thermostat widget
+):
+    "Register thermostat routes and return a slot loading the climate widget. Call once after fast_app()."
+    writes = setup_setpoint_route(rt, t, writes)
+    path = f"/widgets/thermostat/{home_id}/{room_id}"
+    frags = _watch(metrics, FragmentCache(), path)
+    @rt(path)
+    async def get(req):
+        try:
+            with _timed(metrics, 'thermostat', 'fetch'): room, raw = await _fetch(t, _room_data, _aroom_data, home_id, room_id)
+        except APIError: return _retry(path, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')))
+        with _timed(metrics, 'thermostat', 'render'):
+            key = data_key(room, raw)
+            return conditional(req, key, lambda: frags(key, lambda: ThermostatCard(room, raw, home_id=home_id, **kwargs)))
+    slot = LazyWidget(path, every, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')))
+    slot.writes_ = writes
+    return slot
+
+def setup_thermostat_grid(
+    rt,        # FastHTML route decorator from fast_app()
+    t,         # Thermostat instance (authenticated)
+    home_ids=None, # Homes to show, default all
+    writes=None, # `WriteCoalescer` for the setpoint writes, default `setpoint_writes(t)`; the slot keeps it as `writes_`
+    every=None, # Seconds between refreshes of the cards, default load once
+    path='/widgets/thermostats', # Route rendering the cards
+    metrics=None, # `Metrics` timing the route's upstream calls and rendering
+    **kwargs,  # Extra args to pass to `ThermostatGrid`
+):
+    "Register thermostat routes and return a slot loading a card per heated room. Call once after fast_app()."
+    writes = setup_setpoint_route(rt, t, writes)
+    frags = _watch(metrics, FragmentCache(), path)
+    @rt(path)
+    async def get(req):
+        try:
+            with _timed(metrics, 'thermostats', 'fetch'): rooms = await _fetch(t, _grid_data, _agrid_data, home_ids)
+        except APIError: return _retry(path, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')), cls='contents')
+        with _timed(metrics, 'thermostats', 'render'):
+            key = data_key(rooms)
+            return conditional(req, key, lambda: frags(key, lambda: _grid(rooms, **kwargs)))
+    slot = LazyWidget(path, every, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')), cls='contents')
+    slot.writes_ = writes
+    return slot
+
+# %% ../nbs/12_widgets.ipynb 32
+def SolarChart(ts, vals, points=120):
+    "Production, consumption and grid sparklines of `SolarLog` readings"
+    prod,grid = vals[:, 0],vals[:, 1]
+    return ApexChart(opts={
+        'chart': {'type': 'line', 'height': 110, 'sparkline': {'enabled': True}},
+        'series': [
+            {'name': 'Production', 'data': _pairs(ts, prod, points)},
+            {'name': 'Consumption', 'data': _pairs(ts, prod-grid, points)},
+            {'name': 'Grid', 'data': _pairs(ts, grid, points)}
+        ],
+        'xaxis': {'type': 'datetime'},
+        'stroke': {'curve': 'smooth', 'width': [3, 2, 1], 'dashArray': [0, 0, 4]},
+        'colors': ['#fdcb6e', '#ff7675', '#00b894']
+    })
+
+def SolarCard(
+    r, # `result` of a `getRealtimeInfo` response
+    capacity=5000, # total capacity installed in W
+    xtra_classes='w-[320px]',
+    hist=None, # `SolarLog.arrays` to draw as sparklines
+):
+    solar = r.acpower
+    grid = r.feedinpower
+    consumption = solar - grid
+    surplus = grid > 0
+    
+    hour = int(r.uploadTime.split()[1].split(':')[0])
+    is_night = 19 <= hour or hour < 6
+    icon = "☀️" if (solar > 0 or not is_night) else "🌙"
+    
+    return Div(
+        Div(
+            Span("SOLAR", cls="font-display text-xs font-bold text-slate-400 uppercase tracking-widest"),
+            Span(f"{icon} {100*solar/capacity:.0f}%", cls="text-xl"),
+            cls="flex justify-between items-center mb-6"
+        ),
+        Div(
+            Div(
+                Span(f"{solar:.0f}W", cls=f"font-display text-4xl {'text-solar-prod' if solar > 0 else 'text-slate-300'} leading-none"),
+                Span("producing", cls="text-slate-400 text-sm"),
+                cls="flex flex-col"
+            ),
+            Div(
+                Span(f"{consumption:.0f}W", cls=f"font-display text-4xl {'text-temp-real' if surplus else 'text-solar-cons'} leading-none"),
+                Span("using", cls="text-slate-400 text-sm"),
+                cls="flex flex-col"
+            ),
+            cls="flex gap-8"
+        ),
+        Div(SolarChart(*hist), cls="mt-4 -mx-3 h-[110px]") if hist is not None and len(hist[0]) > 1 else None,
+        Div(
+            Span(f"Today: {r.yieldtoday:.1f} kWh", cls="text-slate-400 text-sm"),
+            Span(f"{'↑ Exporting' if surplus else '↓ Importing'} {abs(grid):.0f}W", cls=f"text-sm {'text-green-500' if surplus else 'text-red-400'}"),
+            cls="mt-auto flex justify-between"
+        ),
+        id="solar-card",
+        cls=f"bg-white/85 backdrop-blur-xl border border-white/60 rounded-[32px] p-8 shadow-soft flex flex-col transition-transform hover:-translate-y-1 duration-300 aspect-square {xtra_classes}"
+    )
+
+def _solar_hist(log, r, record=True):
+    "Record `r` in `log` (unless `record` is false) and return the log's last day"
+    if log is None: return None
+    if record: log.record(r)
+    return log.arrays(86400)
+
+def SolarWidget(
+    s, 
+    capacity=5000, # total capacity installed in W
+    xtra_classes='w-[320px]',
+    log=None, # `SolarLog` to record the reading in and draw the last day of
+):
+    r = s.getRealtimeInfo().result
+    return SolarCard(r, capacity, xtra_classes, _solar_hist(log, r))
+
+# %% ../nbs/12_widgets.ipynb 33
+async def AsyncSolarWidget(
+    s, # `AsyncSolaX` client
+    capacity=5000, # total capacity installed in W
+    xtra_classes='w-[320px]',
+    log=None, # `SolarLog` to record the reading in and draw the last day of
+):
+    r = (await s.getRealtimeInfo()).result
+    return SolarCard(r, capacity, xtra_classes, _solar_hist(log, r))
+
+# %% ../nbs/12_widgets.ipynb 38
+def setup_solar_widget(
+    rt, # FastHTML route decorator from fast_app()
+    s,  # `SolaX` or `AsyncSolaX` client, unused with `poller`
+    every=None, # Seconds between refreshes of the card, default load once
+    path='/widgets/solar', # Route rendering the card
+    log=None, # `SolarLog` to record readings in and draw the last day of
+    metrics=None, # `Metrics` timing the route's upstream calls and rendering
+    poller=None, # `Poller` whose latest `solar` reading the card shows instead of calling SolaX; it's left to record them in `log`
+    **kwargs, # Extra args to pass to `SolarCard`
+):
+    "Register the solar card's route and return a slot loading it. Call once after fast_app()."
+    frags = _watch(metrics, FragmentCache(), path)
+    async def reading():
+        if poller is None: return (await _fetch(s, SolaX.getRealtimeInfo, SolaX.getRealtimeInfo)).result
+        if (res := poller.latest.get('solar')) is None: raise LookupError('No solar reading polled yet')
+        return res.result
+    @rt(path)
+    async def get(req):
+        try:
+            with _timed(metrics, 'solar', 'fetch'): r = await reading()
+        except (APIError, LookupError): return _retry(path, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')))
+        with _timed(metrics, 'solar', 'render'):
+            hist = _solar_hist(log, r, poller is None)
+            key = data_key(r, hist)
+            return conditional(req, key, lambda: frags(key, lambda: SolarCard(r, hist=hist, **kwargs)))
+    return LazyWidget(path, every, Skeleton(kwargs.get('xtra_classes', 'w-[320px]')))
@@ -0,0 +1,48 @@
+"""Collapse bursts of writes into one upstream call"""
+
+# AUTOGENERATED! DO NOT EDIT! File to edit: ../nbs/10_writes.ipynb.
+
+# %% auto 0
+__all__ = ['WriteCoalescer']
+
+# %% ../nbs/10_writes.ipynb 2
+import asyncio, inspect
+from collections import Counter
+
+# %% ../nbs/10_writes.ipynb 5
+class WriteCoalescer:
+    "Collapses writes per key within `window` seconds into a single call with the latest arguments"
+    def __init__(self, write, window=1.):
+        self.write,self.window = write,window
+        self.pending,self.timers,self.locks,self.tasks,self.errors = {},{},{},set(),{}
+        self.gen,self.stats = Counter(),Counter()
+
+    def submit(self, key, *args):
+        "Schedule `write(*args)` for `key` once it's been quiet for `window` seconds, replacing any pending write"
+        self.stats['submitted'] += 1
+        self.gen[key] += 1
+        self.pending[key] = args
+        if (h := self.timers.pop(key, None)) is not None: h.cancel(); self.stats['coalesced'] += 1
+        self.timers[key] = asyncio.get_running_loop().call_later(self.window, self._start, key, self.gen[key])
+
+    def _start(self, key, gen):
+        self.timers.pop(key, None)
+        t = asyncio.create_task(self._flush(key, gen))
+        self.tasks.add(t)
+        t.add_done_callback(self.tasks.discard)
+
+    async def _flush(self, key, gen):
+        async with self.locks.setdefault(key, asyncio.Lock()):
+            if self.gen[key] != gen or key not in self.pending: self.stats['superseded'] += 1; return
+            args = self.pending.pop(key)
+            try:
+                r = self.write(*args)
+                if inspect.isawaitable(r): await r
+                self.stats['written'] += 1
+                self.errors.pop(key, None)
+            except Exception as e: self.stats['failed'] += 1; self.errors[key] = e
+
+    async def flush(self):
+        "Write everything pending now and wait for in-flight writes"
+        for key,h in list(self.timers.items()): h.cancel(); self._start(key, self.gen[key])
+        await asyncio.gather(*self.tasks)